@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections import defaultdict
 from typing import TYPE_CHECKING
 
 from loguru import logger as lg
@@ -124,6 +125,20 @@ class LocationService:
         """
         return self._repo.list_all()
 
+    def get_full_tree(self) -> dict[uuid.UUID | None, list[Location]]:
+        """Load the whole hierarchy in one query, grouped by parent.
+
+        Locations come back ordered by materialized path, so each child
+        list is already in display order.
+
+        Returns:
+            Mapping of parent UUID (None for root-level) to child Locations.
+        """
+        tree: dict[uuid.UUID | None, list[Location]] = defaultdict(list)
+        for location in self._repo.list_all():
+            tree[location.parent_id].append(location)
+        return tree
+
     def get_children(self, parent_id: uuid.UUID | None = None) -> list[Location]:
         """List direct children of a location.
 
@@ -10,6 +10,7 @@ import uuid
 
 from loguru import logger as lg
 
+from shelf_mind.application.errors import LocationNotFoundError
 from shelf_mind.application.errors import ThingNotFoundError
 from shelf_mind.domain.entities.thing import Thing
 from shelf_mind.domain.schemas.metadata_schema import MetadataSchema
@@ -17,6 +18,7 @@ from shelf_mind.domain.schemas.metadata_schema import MetadataSchema
 if TYPE_CHECKING:
     import uuid
 
+    from shelf_mind.domain.repositories.location_repository import LocationRepository
     from shelf_mind.domain.repositories.placement_repository import PlacementRepository
     from shelf_mind.domain.repositories.thing_repository import ThingRepository
     from shelf_mind.domain.repositories.vector_repository import VectorRepository
@@ -35,6 +37,7 @@ class ThingService:
         embedder: TextEmbeddingProvider for generating vectors.
         enricher: MetadataEnricher for extracting structured metadata.
         placement_repo: PlacementRepository for cascade deletion.
+        location_repo: LocationRepository for create-and-place lookups.
     """
 
     def __init__(
@@ -44,6 +47,7 @@ class ThingService:
         embedder: TextEmbeddingProvider,
         enricher: MetadataEnricher,
         placement_repo: PlacementRepository | None = None,
+        location_repo: LocationRepository | None = None,
     ) -> None:
         """Initialize with repository and infrastructure dependencies.
 
@@ -53,12 +57,14 @@ class ThingService:
             embedder: TextEmbeddingProvider for generating vectors.
             enricher: MetadataEnricher for extracting structured metadata.
             placement_repo: PlacementRepository for cascade deletion.
+            location_repo: LocationRepository for create-and-place lookups.
         """
         self._repo = repo
         self._vector_repo = vector_repo
         self._embedder = embedder
         self._enricher = enricher
         self._placement_repo = placement_repo
+        self._location_repo = location_repo
 
     def create_thing(
         self,
@@ -102,6 +108,52 @@ class ThingService:
         lg.info(f"Created thing: '{name}' ({thing.id})")
         return thing
 
+    def create_and_place(
+        self,
+        name: str,
+        location_id: uuid.UUID,
+        description: str = "",
+    ) -> Thing:
+        """Register a new Thing already placed at a Location.
+
+        The Thing row and its initial Placement are written in a single
+        transaction, and the location path used for payload indexing is
+        resolved from the same lookup that validates the Location.
+
+        Args:
+            name: Thing name (1-120 chars, required).
+            location_id: UUID of the Location to place it at.
+            description: Optional description.
+
+        Returns:
+            Created Thing.
+
+        Raises:
+            RuntimeError: If the service was built without a location repo.
+            LocationNotFoundError: If the Location does not exist.
+        """
+        if self._location_repo is None:
+            msg = "ThingService has no LocationRepository configured"
+            raise RuntimeError(msg)
+        location = self._location_repo.get_by_id(location_id)
+        if location is None:
+            msg = f"Location {location_id} not found"
+            raise LocationNotFoundError(msg)
+
+        metadata = self._enricher.enrich(name, description or None)
+        thing = Thing(
+            name=name,
+            description=description,
+            metadata_json=metadata.model_dump_json(),
+        )
+        thing = self._repo.create_placed(thing, location_id)
+
+        embed_text = self._build_embed_text(name, description, metadata.tags)
+        self._index_text_vector(thing, embed_text, metadata, location.path)
+
+        lg.info(f"Created thing: '{name}' ({thing.id}) at '{location.path}'")
+        return thing
+
     def get_thing(self, thing_id: uuid.UUID) -> Thing:
         """Get a Thing by id.
 
@@ -54,6 +54,14 @@ class SessionConfig(BaseModelKwargs):
         default=False,
         description="Whether to require HTTPS for cookies (enable in prod)",
     )
+    cleanup_interval: int = Field(
+        default=3600,  # 1 hour
+        description="Seconds between background purges of expired sessions",
+    )
+    db_path: str = Field(
+        default="data/sessions.db",
+        description="SQLite file backing the persistent session store",
+    )
 
 
 class RateLimitConfig(BaseModelKwargs):
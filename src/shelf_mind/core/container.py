@@ -224,6 +224,7 @@ class Container:
             embedder=self.get_embedder(),
             enricher=self.get_enricher(),
             placement_repo=placement_repo,
+            location_repo=SqlLocationRepository(session),
         )
 
     def placement_service(self, session: Session) -> PlacementService:
@@ -21,6 +21,18 @@ class ThingRepository(ABC):
             Created Thing with generated id.
         """
 
+    @abstractmethod
+    def create_placed(self, thing: Thing, location_id: uuid.UUID) -> Thing:
+        """Persist a new Thing and its initial active Placement atomically.
+
+        Args:
+            thing: Thing entity to create.
+            location_id: UUID of the Location to place it at.
+
+        Returns:
+            Created Thing with generated id.
+        """
+
     @abstractmethod
     def get_by_id(self, thing_id: uuid.UUID) -> Thing | None:
         """Retrieve a Thing by its id.
@@ -9,6 +9,9 @@ from shelf_mind.domain.entities.location import Location
 from shelf_mind.domain.entities.placement import Placement
 from shelf_mind.domain.repositories.location_repository import LocationRepository
 
+# Sorts after any character that can follow a prefix in a stored path
+_MAX_CODEPOINT = "\U0010ffff"
+
 
 class SqlLocationRepository(LocationRepository):
     """SQLModel-backed Location repository.
@@ -83,7 +86,12 @@ class SqlLocationRepository(LocationRepository):
         Returns:
             All locations whose path starts with prefix.
         """
-        stmt = select(Location).where(Location.path.startswith(path_prefix))  # type: ignore[union-attr]
+        # A half-open range lets SQLite search the path index; LIKE 'prefix%'
+        # is case-insensitive there and always falls back to a table scan
+        stmt = select(Location).where(
+            Location.path >= path_prefix,
+            Location.path < path_prefix + _MAX_CODEPOINT,
+        )
         return list(self._session.exec(stmt).all())
 
     def list_all(self) -> list[Location]:
@@ -2,13 +2,25 @@
 
 import uuid
 
+from sqlalchemy import Integer
+from sqlalchemy import bindparam
 from sqlmodel import Session
 from sqlmodel import func
 from sqlmodel import select
 
+from shelf_mind.domain.entities.placement import Placement
 from shelf_mind.domain.entities.thing import Thing
 from shelf_mind.domain.repositories.thing_repository import ThingRepository
 
+# Built once with bound parameters, so each search only binds values instead
+# of rebuilding the construct and recomputing its compiled-cache key
+_SEARCH_BY_NAME_STMT = (
+    select(Thing)
+    .where(Thing.name.contains(bindparam("query")))  # type: ignore[union-attr]
+    .limit(bindparam("limit", type_=Integer))
+    .order_by(Thing.name)  # type: ignore[arg-type]
+)
+
 
 class SqlThingRepository(ThingRepository):
     """SQLModel-backed Thing repository.
@@ -39,6 +51,26 @@ class SqlThingRepository(ThingRepository):
         self._session.refresh(thing)
         return thing
 
+    def create_placed(self, thing: Thing, location_id: uuid.UUID) -> Thing:
+        """Persist a new Thing and its initial active Placement in one commit.
+
+        A new Thing has no prior placements, so nothing needs deactivating.
+
+        Args:
+            thing: Thing entity to create.
+            location_id: UUID of the Location to place it at.
+
+        Returns:
+            Created Thing with generated id.
+        """
+        self._session.add(thing)
+        self._session.add(
+            Placement(thing_id=thing.id, location_id=location_id, active=True),
+        )
+        self._session.commit()
+        self._session.refresh(thing)
+        return thing
+
     def get_by_id(self, thing_id: uuid.UUID) -> Thing | None:
         """Retrieve a Thing by its id.
 
@@ -125,10 +157,5 @@ class SqlThingRepository(ThingRepository):
         Returns:
             Matching Thing records.
         """
-        stmt = (
-            select(Thing)
-            .where(Thing.name.contains(query))  # type: ignore[union-attr]
-            .limit(limit)
-            .order_by(Thing.name)  # type: ignore[arg-type]
-        )
-        return list(self._session.exec(stmt).all())
+        params = {"query": query, "limit": limit}
+        return list(self._session.exec(_SEARCH_BY_NAME_STMT, params=params).all())
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from abc import ABC
 from abc import abstractmethod
+import asyncio
 
 from loguru import logger as lg
 
@@ -179,6 +180,26 @@ class MetadataEnricher(ABC):
             Populated MetadataSchema.
         """
 
+    async def aenrich(
+        self,
+        name: str,
+        description: str | None = None,
+    ) -> MetadataSchema:
+        """Awaitable variant of ``enrich`` for use from async routes.
+
+        The default runs ``enrich`` in a worker thread so blocking
+        implementations (network, model inference) do not stall the event
+        loop. Natively async enrichers should override this.
+
+        Args:
+            name: Thing name.
+            description: Optional description.
+
+        Returns:
+            Populated MetadataSchema.
+        """
+        return await asyncio.to_thread(self.enrich, name, description)
+
 
 class RuleBasedMetadataEnricher(MetadataEnricher):
     """Deterministic rule-based metadata enricher.
@@ -216,6 +237,22 @@ class RuleBasedMetadataEnricher(MetadataEnricher):
             usage_context=usage_context,
         )
 
+    async def aenrich(
+        self,
+        name: str,
+        description: str | None = None,
+    ) -> MetadataSchema:
+        """Enrich inline: keyword rules are cheaper than a thread hop.
+
+        Args:
+            name: Thing name.
+            description: Optional description text.
+
+        Returns:
+            Populated MetadataSchema.
+        """
+        return self.enrich(name, description)
+
     @staticmethod
     def _detect_category(tokens: set[str]) -> str:
         """Match tokens against category keyword lists.
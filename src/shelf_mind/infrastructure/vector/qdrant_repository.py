@@ -1,5 +1,6 @@
 """Qdrant implementation of VectorRepository."""
 
+import functools
 import uuid
 
 from loguru import logger as lg
@@ -10,6 +11,65 @@ from shelf_mind.domain.repositories.vector_repository import VectorRepository
 from shelf_mind.domain.schemas.search_schemas import SearchResult
 
 
+@functools.lru_cache(maxsize=64)
+def _build_text_filter(
+    location_filter: str | None,
+    category_filter: str | None,
+    material_filter: str | None,
+    tags_filter: tuple[str, ...],
+) -> models.Filter | None:
+    """Build the Qdrant payload filter for a text search.
+
+    Memoized on the filter tuple: as-you-type searches resend identical
+    filters, and only the conditions that are actually set are emitted.
+
+    Args:
+        location_filter: Optional location_path prefix filter.
+        category_filter: Optional category exact match.
+        material_filter: Optional material keyword filter.
+        tags_filter: Tags that must all be present (empty for none).
+
+    Returns:
+        Filter with one condition per active filter, or None if none are set.
+    """
+    conditions: list[models.Condition] = []
+
+    if location_filter:
+        conditions.append(
+            models.FieldCondition(
+                key="location_path",
+                match=models.MatchText(text=location_filter),
+            ),
+        )
+
+    if category_filter:
+        conditions.append(
+            models.FieldCondition(
+                key="category",
+                match=models.MatchValue(value=category_filter),
+            ),
+        )
+
+    if material_filter:
+        conditions.append(
+            models.FieldCondition(
+                key="description",
+                match=models.MatchText(text=material_filter),
+            ),
+        )
+
+    if tags_filter:
+        conditions.extend(
+            models.FieldCondition(
+                key="tags",
+                match=models.MatchValue(value=tag),
+            )
+            for tag in tags_filter
+        )
+
+    return models.Filter(must=conditions) if conditions else None
+
+
 class QdrantVectorRepository(VectorRepository):
     """Qdrant-backed vector storage and similarity search.
 
@@ -165,42 +225,12 @@ class QdrantVectorRepository(VectorRepository):
         Returns:
             Ranked search results with scores.
         """
-        conditions: list[models.Condition] = []
-
-        if location_filter:
-            conditions.append(
-                models.FieldCondition(
-                    key="location_path",
-                    match=models.MatchText(text=location_filter),
-                ),
-            )
-
-        if category_filter:
-            conditions.append(
-                models.FieldCondition(
-                    key="category",
-                    match=models.MatchValue(value=category_filter),
-                ),
-            )
-
-        if material_filter:
-            conditions.append(
-                models.FieldCondition(
-                    key="description",
-                    match=models.MatchText(text=material_filter),
-                ),
-            )
-
-        if tags_filter:
-            conditions.extend(
-                models.FieldCondition(
-                    key="tags",
-                    match=models.MatchValue(value=tag),
-                )
-                for tag in tags_filter
-            )
-
-        query_filter = models.Filter(must=conditions) if conditions else None
+        query_filter = _build_text_filter(
+            location_filter or None,
+            category_filter or None,
+            material_filter or None,
+            tuple(tags_filter) if tags_filter else (),
+        )
 
         results = self._client.query_points(
             collection_name=self._collection,
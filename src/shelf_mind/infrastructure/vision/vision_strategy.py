@@ -50,7 +50,8 @@ class NoOpVisionStrategy(VisionStrategy):
         Args:
             vector_dim: Size of the zero vector to return.
         """
-        self._dim = vector_dim
+        # Built once; embed() hands out copies so callers may mutate them
+        self._zero_vector = [0.0] * vector_dim
         lg.info("Using NoOp vision strategy (Phase 1)")
 
     def embed(self, image_array: Any) -> list[list[float]]:  # noqa: ANN401, ARG002
@@ -60,9 +61,9 @@ class NoOpVisionStrategy(VisionStrategy):
             image_array: Ignored.
 
         Returns:
-            List with one zero vector.
+            List with one fresh zero vector.
         """
-        return [[0.0] * self._dim]
+        return [self._zero_vector.copy()]
 
     def preprocess(self, image_bytes: bytes) -> Any:  # noqa: ANN401
         """No-op preprocessing.
@@ -3,16 +3,29 @@
 https://stackoverflow.com/questions/6760685/what-is-the-best-way-of-implementing-singleton-in-python
 """
 
+import threading
 from typing import ClassVar
 
 
 class Singleton(type):
-    """Singleton metaclass."""
+    """Singleton metaclass.
+
+    Instance lookup is lock-free; the lock is only taken to create the
+    first instance, so concurrent first calls still build exactly one.
+    """
 
     _instances: ClassVar = {}
+    # Re-entrant so a singleton's __init__ may instantiate another singleton
+    _lock: ClassVar = threading.RLock()
 
     def __call__(cls, *args, **kwargs):  # noqa: ANN002, ANN003, ANN204
         """Singleton instance creation."""
-        if cls not in cls._instances:
-            cls._instances[cls] = super().__call__(*args, **kwargs)
-        return cls._instances[cls]
+        instance = cls._instances.get(cls)
+        if instance is not None:
+            return instance
+        with cls._lock:
+            instance = cls._instances.get(cls)
+            if instance is None:
+                instance = super().__call__(*args, **kwargs)
+                cls._instances[cls] = instance
+        return instance
@@ -6,13 +6,13 @@ from fastapi import Depends
 from shelf_mind.webapp.api.v1.location_router import router as location_router
 from shelf_mind.webapp.api.v1.search_router import router as search_router
 from shelf_mind.webapp.api.v1.thing_router import router as thing_router
-from shelf_mind.webapp.core.dependencies import get_current_user
+from shelf_mind.webapp.core.dependencies import get_current_user_id
 from shelf_mind.webapp.schemas.common_schemas import MessageResponse
 
 router = APIRouter(
     prefix="/api/v1",
     tags=["api-v1"],
-    dependencies=[Depends(get_current_user)],
+    dependencies=[Depends(get_current_user_id)],
 )
 
 # Include domain routers
@@ -20,7 +20,7 @@ if TYPE_CHECKING:
 
     from shelf_mind.config.webapp import WebappConfig
     from shelf_mind.core.container import Container
-    from shelf_mind.webapp.services.auth_service import SessionStore
+    from shelf_mind.webapp.services.auth_service import BaseSessionStore
 
 
 @lru_cache
@@ -33,14 +33,14 @@ def get_settings() -> WebappConfig:
     return get_webapp_params().to_config()
 
 
-def get_session_store(request: Request) -> SessionStore:
+def get_session_store(request: Request) -> BaseSessionStore:
     """Get the session store from app state.
 
     Args:
         request: FastAPI request object.
 
     Returns:
-        SessionStore instance.
+        Session store instance.
     """
     return request.app.state.session_store
 
@@ -87,6 +87,33 @@ async def get_current_user(
     return session
 
 
+async def get_current_user_id(
+    request: Request,
+    session: Annotated[str | None, Cookie(alias="session")] = None,
+) -> str:
+    """Get the authenticated user's ID without loading the full session.
+
+    For routes that only need to enforce authentication: the store reads
+    the identity columns and skips deserializing the session.
+
+    Args:
+        request: FastAPI request object.
+        session: Session ID from cookie.
+
+    Returns:
+        User ID of the authenticated user.
+
+    Raises:
+        NotAuthenticatedException: If no valid session.
+    """
+    identity = (
+        get_session_store(request).get_session_identity(session) if session else None
+    )
+    if identity is None:
+        raise NotAuthenticatedException
+    return identity[0]
+
+
 async def get_optional_user(
     session: Annotated[SessionData | None, Depends(get_current_session)],
 ) -> SessionData | None:
@@ -126,6 +153,11 @@ def get_domain_container(request: Request) -> Container:
 def get_domain_session(request: Request) -> Generator[Session]:  # noqa: ARG001
     """Get a SQLModel session from the domain container.
 
+    The session's identity map doubles as a request-scoped cache: repeated
+    ``get_by_id`` lookups (e.g. the same Location fetched by a route and
+    again by a service) resolve without SQL. ``expire_on_commit`` is off so
+    that cache survives the commits repositories issue mid-request.
+
     Args:
         request: FastAPI request object.
 
@@ -135,5 +167,5 @@ def get_domain_session(request: Request) -> Generator[Session]:  # noqa: ARG001
     from shelf_mind.infrastructure.db.database import get_engine  # noqa: PLC0415
 
     engine = get_engine()
-    with Session(engine) as session:
+    with Session(engine, expire_on_commit=False) as session:
         yield session
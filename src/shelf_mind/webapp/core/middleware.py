@@ -45,6 +45,13 @@ class SecurityHeadersMiddleware(BaseHTTPMiddleware):
 
     Implements CSP route-splitting: strict policy for app pages,
     relaxed policy for ``/docs`` and ``/redoc`` (Swagger UI).
+
+    HTMX sub-requests (``HX-Request: true``) only get the headers that
+    apply to fetched content (nosniff, Referrer-Policy and, in production,
+    HSTS): CSP, framing and XSS-auditor headers are ignored by browsers on
+    XHR responses, so they are skipped for those fragments and stay on full
+    page loads. Every response carries ``Vary: HX-Request`` so the two
+    variants are cached separately.
     """
 
     # Paths that require the relaxed (Swagger UI) CSP
@@ -115,23 +122,26 @@ class SecurityHeadersMiddleware(BaseHTTPMiddleware):
 
         # Always add these headers
         response.headers["X-Content-Type-Options"] = "nosniff"
+        response.headers["Referrer-Policy"] = "strict-origin-when-cross-origin"
+        # A URL may serve an HTMX fragment or a full page, so a cached
+        # fragment must never be reused for a top-level navigation
+        response.headers.add_vary_header("HX-Request")
+
+        # HSTS only in production (requires HTTPS); applies to every response
+        if self.is_production:
+            response.headers["Strict-Transport-Security"] = (
+                "max-age=31536000; includeSubDomains"
+            )
+
         response.headers["X-Frame-Options"] = "DENY"
         response.headers["X-XSS-Protection"] = "1; mode=block"
-        response.headers["Referrer-Policy"] = "strict-origin-when-cross-origin"
 
         # CSP route-splitting: relaxed for docs, strict for everything else
-        path = request.url.path
-        if any(path.startswith(prefix) for prefix in self._DOCS_PREFIXES):
+        if request.url.path.startswith(self._DOCS_PREFIXES):
             response.headers["Content-Security-Policy"] = self.docs_csp
         else:
             response.headers["Content-Security-Policy"] = self.strict_csp
 
-        # HSTS only in production (requires HTTPS)
-        if self.is_production:
-            response.headers["Strict-Transport-Security"] = (
-                "max-age=31536000; includeSubDomains"
-            )
-
         return response
 
 
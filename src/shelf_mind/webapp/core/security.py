@@ -9,6 +9,7 @@ from datetime import timedelta
 import hashlib
 import html
 import secrets
+import time
 
 from itsdangerous import BadSignature
 from itsdangerous import SignatureExpired
@@ -81,6 +82,9 @@ class TokenManager:
         return self.validate_token(token, salt="csrf", max_age=max_age) is not None
 
 
+# Session IDs and state tokens are drawn from the OS CSPRNG on every call,
+# never from a pre-generated pool: a pool filled at import time would be
+# copied into every forked worker and hand out identical session IDs.
 def generate_session_id() -> str:
     """Generate a secure random session ID.
 
@@ -159,6 +163,52 @@ def get_expiration_time(seconds: int) -> datetime:
     return datetime.now(UTC) + timedelta(seconds=seconds)
 
 
+# Expiry checks run on every authenticated request; expiries are set in
+# seconds, so reading the wall clock at most every 50 ms is precise enough.
+_CLOCK_RESOLUTION_SECONDS = 0.05
+
+
+class _CoarseClock:
+    """UTC wall clock refreshed at most once per resolution window."""
+
+    __slots__ = ("_checked_at", "_now", "_timestamp")
+
+    def __init__(self) -> None:
+        """Initialize with a stale reading so the first call refreshes."""
+        self._checked_at = float("-inf")
+        self._now = datetime.now(UTC)
+        self._timestamp = self._now.timestamp()
+
+    def _refresh(self) -> None:
+        """Re-read the wall clock if the cached reading is too old."""
+        tick = time.monotonic()
+        if tick - self._checked_at >= _CLOCK_RESOLUTION_SECONDS:
+            self._checked_at = tick
+            self._now = datetime.now(UTC)
+            self._timestamp = self._now.timestamp()
+
+    def now(self) -> datetime:
+        """Return the cached current UTC datetime.
+
+        Returns:
+            Current time, at most one resolution window old.
+        """
+        self._refresh()
+        return self._now
+
+    def timestamp(self) -> float:
+        """Return the cached current Unix timestamp.
+
+        Returns:
+            Current epoch seconds, at most one resolution window old.
+        """
+        self._refresh()
+        return self._timestamp
+
+
+_clock = _CoarseClock()
+
+
 def is_expired(expiration: datetime) -> bool:
     """Check if a datetime has passed.
 
@@ -168,4 +218,13 @@ def is_expired(expiration: datetime) -> bool:
     Returns:
         True if expired, False otherwise.
     """
-    return datetime.now(UTC) > expiration
+    return _clock.now() > expiration
+
+
+def utc_timestamp() -> float:
+    """Get the current Unix timestamp for expiry comparisons.
+
+    Returns:
+        Current epoch seconds, at most 50 ms stale.
+    """
+    return _clock.timestamp()
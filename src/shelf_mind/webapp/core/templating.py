@@ -1,28 +1,127 @@
 """Jinja2 template engine configuration.
 
 Provides a configured ``Jinja2Templates`` instance used by page routes
-to render HTML responses.
+to render HTML responses, plus a small bounded render cache for pages
+whose HTML depends only on a handful of inputs.
 """
 
 from __future__ import annotations
 
+from collections import OrderedDict
+import time
 from typing import TYPE_CHECKING
+from typing import Any
 
 from starlette.templating import Jinja2Templates
 
 from shelf_mind.params.shelf_mind_params import get_shelf_mind_paths
 
 if TYPE_CHECKING:
+    from collections.abc import Hashable
+
     from shelf_mind.config.webapp import WebappConfig
 
 # Resolve the templates directory from ShelfMindPaths (single source of truth)
 templates = Jinja2Templates(directory=str(get_shelf_mind_paths().templates_fol))
 
 
+class RenderCache:
+    """Bounded in-memory LRU cache of rendered HTML with a TTL.
+
+    Values may be text or pre-encoded bytes; both are valid
+    ``HTMLResponse`` content.
+
+    Entries older than ``ttl`` seconds are treated as missing, and the
+    least recently used entry is evicted once ``maxsize`` is reached.
+
+    Args:
+        maxsize: Maximum number of cached entries.
+        ttl: Time-to-live of an entry in seconds.
+    """
+
+    def __init__(self, maxsize: int = 256, ttl: float = 60.0) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            maxsize: Maximum number of cached entries.
+            ttl: Time-to-live of an entry in seconds.
+        """
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._entries: OrderedDict[Hashable, tuple[float, str | bytes]] = OrderedDict()
+
+    def get(self, key: Hashable) -> str | bytes | None:
+        """Return the cached HTML for ``key`` if present and fresh.
+
+        Args:
+            key: Cache key.
+
+        Returns:
+            Cached HTML, or None on miss or expiry.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, html = entry
+        if time.monotonic() >= expires_at:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return html
+
+    def set(self, key: Hashable, html: str | bytes) -> None:
+        """Store rendered HTML under ``key``, evicting the oldest if full.
+
+        Args:
+            key: Cache key.
+            html: Rendered HTML.
+        """
+        self._entries[key] = (time.monotonic() + self._ttl, html)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached entries."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        """Return the number of stored entries (fresh or not)."""
+        return len(self._entries)
+
+
+render_cache = RenderCache()
+
+
+def render_cached(
+    key: Hashable,
+    name: str,
+    context: dict[str, Any],
+) -> str | bytes:
+    """Render a template, reusing the cached HTML for ``key`` when available.
+
+    Only use for templates whose output is fully determined by ``key``.
+
+    Args:
+        key: Cache key identifying the rendered output.
+        name: Template name.
+        context: Template context.
+
+    Returns:
+        Rendered HTML.
+    """
+    html = render_cache.get(key)
+    if html is None:
+        html = templates.get_template(name).render(context)
+        render_cache.set(key, html)
+    return html
+
+
 def configure_templates(config: WebappConfig) -> None:
     """Inject application-wide globals into the Jinja2 environment.
 
-    Called once during ``create_app()`` after config is loaded.
+    Called once during ``create_app()`` after config is loaded. Clears the
+    render cache since cached pages embed the previous globals.
 
     Args:
         config: Webapp configuration.
@@ -34,3 +133,4 @@ def configure_templates(config: WebappConfig) -> None:
             "debug": config.debug,
         },
     )
+    render_cache.clear()
@@ -3,8 +3,10 @@
 Creates and configures the FastAPI application instance.
 """
 
+import asyncio
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
+from contextlib import suppress
 
 from fastapi import FastAPI
 from fastapi import Request
@@ -32,8 +34,8 @@ from shelf_mind.webapp.routers import auth_router
 from shelf_mind.webapp.routers import health_router
 from shelf_mind.webapp.routers import pages_router
 from shelf_mind.webapp.schemas.common_schemas import ErrorResponse
+from shelf_mind.webapp.services.auth_service import BaseSessionStore
 from shelf_mind.webapp.services.auth_service import GoogleAuthService
-from shelf_mind.webapp.services.auth_service import SessionStore
 from shelf_mind.webapp.services.auth_service import SqliteSessionStore
 
 
@@ -52,12 +54,20 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None]:
     # Startup
     lg.info("Starting webapp...")
 
+    config: WebappConfig = app.state.config
+
     # Initialize session store (persistent SQLite-backed)
-    session_store: SessionStore = SqliteSessionStore()
+    session_store: BaseSessionStore = SqliteSessionStore(
+        db_path=config.session.db_path,
+    )
     app.state.session_store = session_store
 
+    # Purge expired sessions in the background, off the request path
+    cleanup_task = asyncio.create_task(
+        session_store.run_cleanup_loop(config.session.cleanup_interval),
+    )
+
     # Initialize auth service
-    config: WebappConfig = app.state.config
     auth_service = GoogleAuthService(
         oauth_config=config.google_oauth,
         session_config=config.session,
@@ -83,7 +93,11 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None]:
 
     # Shutdown
     lg.info("Shutting down webapp...")
-    # Cleanup resources here if needed
+    cleanup_task.cancel()
+    with suppress(asyncio.CancelledError):
+        await cleanup_task
+    await auth_service.aclose()
+    session_store.close()
     lg.info("Webapp shutdown complete")
 
 
@@ -5,6 +5,9 @@ Serves server-rendered Jinja2 templates for the browser UI.
 
 from __future__ import annotations
 
+import functools
+import hashlib
+from typing import TYPE_CHECKING
 from typing import Annotated
 
 from fastapi import APIRouter
@@ -14,17 +17,24 @@ from fastapi import Query
 from fastapi import Request
 from fastapi.responses import HTMLResponse
 from fastapi.responses import RedirectResponse
+from fastapi.responses import Response
 from loguru import logger as lg
 from sqlmodel import Session  # noqa: TC002
 
 from shelf_mind.core.container import Container  # noqa: TC001
 from shelf_mind.webapp.core.dependencies import get_current_user
+from shelf_mind.webapp.core.dependencies import get_current_user_id
 from shelf_mind.webapp.core.dependencies import get_domain_container
 from shelf_mind.webapp.core.dependencies import get_domain_session
 from shelf_mind.webapp.core.dependencies import get_optional_user
+from shelf_mind.webapp.core.templating import RenderCache
+from shelf_mind.webapp.core.templating import render_cached
 from shelf_mind.webapp.core.templating import templates
 from shelf_mind.webapp.schemas.auth_schemas import SessionData  # noqa: TC001
 
+if TYPE_CHECKING:
+    from shelf_mind.domain.schemas.metadata_schema import MetadataSchema
+
 # Map OAuth error codes to user-friendly messages
 _ERROR_MESSAGES: dict[str, str] = {
     "access_denied": "Access was denied. Please try again.",
@@ -32,9 +42,111 @@ _ERROR_MESSAGES: dict[str, str] = {
     "invalid_state": "Session expired. Please try again.",
 }
 
+# Previews fire on every keystroke, so they get their own small cache
+# instead of evicting rendered pages from the shared one
+_preview_cache = RenderCache(maxsize=64)
+
 router = APIRouter(tags=["pages"])
 
 
+def _etag_response(request: Request, body: str | bytes) -> Response:
+    """Return ``body`` with a strong ETag, or 304 if the client already has it.
+
+    ``no-cache`` makes the browser revalidate on every request, so a change
+    is visible at once while an unchanged partial costs only an empty 304.
+
+    Args:
+        request: Incoming request (read for ``If-None-Match``).
+        body: Rendered HTML.
+
+    Returns:
+        HTML response, or an empty 304 when the ETag matches.
+    """
+    content = body.encode() if isinstance(body, str) else body
+    etag = f'"{hashlib.sha256(content).hexdigest()[:32]}"'
+    # Partials depend on the session cookie: vary on it so a cached copy is
+    # never reused after logging in as another account
+    headers = {
+        "ETag": etag,
+        "Cache-Control": "private, no-cache",
+        "Vary": "Cookie",
+    }
+    if_none_match = request.headers.get("if-none-match", "")
+    if etag in (tag.strip() for tag in if_none_match.split(",")):
+        return Response(status_code=304, headers=headers)
+    return HTMLResponse(content=content, headers=headers)
+
+
+def _user_key(user: SessionData | None) -> tuple[str, ...] | None:
+    """Build a cache key from the user fields the navbar and pages render.
+
+    Args:
+        user: Current user session, if any.
+
+    Returns:
+        Hashable key, or None for anonymous visitors.
+    """
+    if user is None:
+        return None
+    return (user.user_id, user.name, user.email, user.picture or "")
+
+
+def _render_page(user: SessionData, active_page: str, name: str) -> HTMLResponse:
+    """Render a full page whose context is just the user and the active tab.
+
+    Args:
+        user: Authenticated user session.
+        active_page: Navbar tab to highlight.
+        name: Template name.
+
+    Returns:
+        Page HTML, served from the render cache when possible.
+    """
+    html = render_cached(
+        (active_page, _user_key(user)),
+        name,
+        {"user": user, "active_page": active_page},
+    )
+    return HTMLResponse(content=html)
+
+
+def _render_preview(meta: MetadataSchema) -> bytes:
+    """Render the metadata preview card as UTF-8 bytes.
+
+    Args:
+        meta: Enriched metadata.
+
+    Returns:
+        Encoded preview card HTML.
+    """
+    html = (
+        '<div class="box">'
+        f"<p><strong>Category:</strong> {meta.category}</p>"
+        f"<p><strong>Material:</strong> {meta.material}</p>"
+        f"<p><strong>Room hint:</strong> {meta.room_hint}</p>"
+        f"<p><strong>Tags:</strong> {', '.join(meta.tags)}</p>"
+        f"<p><strong>Usage:</strong> {meta.usage_context}</p>"
+        "</div>"
+    )
+    return html.encode()
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_tags(raw: str) -> tuple[str, ...]:
+    """Split a comma-separated tags form value into stripped, non-empty tags.
+
+    Memoized on the raw value, since HTMX-driven searches resend the same
+    filter on every keystroke.
+
+    Args:
+        raw: Raw comma-separated tags string.
+
+    Returns:
+        Tuple of tags (empty if none).
+    """
+    return tuple(t for t in (part.strip() for part in raw.split(",")) if t)
+
+
 @router.get(
     "/",
     response_model=None,
@@ -42,14 +154,12 @@ router = APIRouter(tags=["pages"])
     include_in_schema=False,
 )
 async def landing(
-    request: Request,
     user: Annotated[SessionData | None, Depends(get_optional_user)],
     error: Annotated[str | None, Query()] = None,
 ) -> HTMLResponse | RedirectResponse:
     """Render public landing page or redirect authenticated users.
 
     Args:
-        request: Incoming request.
         user: Current user session, if any.
         error: OAuth error code from callback redirect.
 
@@ -66,32 +176,28 @@ async def landing(
             "message": _ERROR_MESSAGES.get(error, f"An error occurred: {error}"),
         }
 
-    return templates.TemplateResponse(
-        request,
-        "pages/landing.html",
-        {"user": None, "flash": flash, "active_page": "landing"},
-    )
+    context = {"user": None, "flash": flash, "active_page": "landing"}
+    # Only known codes are cached; arbitrary query values would churn the cache
+    if error and error not in _ERROR_MESSAGES:
+        html = templates.get_template("pages/landing.html").render(context)
+    else:
+        html = render_cached(("landing", error or ""), "pages/landing.html", context)
+    return HTMLResponse(content=html)
 
 
 @router.get("/dashboard", response_class=HTMLResponse, include_in_schema=False)
 async def dashboard(
-    request: Request,
     user: Annotated[SessionData, Depends(get_current_user)],
 ) -> HTMLResponse:
     """Render authenticated dashboard.
 
     Args:
-        request: Incoming request.
         user: Authenticated user session.
 
     Returns:
         Dashboard page HTML.
     """
-    return templates.TemplateResponse(
-        request,
-        "pages/dashboard.html",
-        {"user": user, "active_page": "dashboard"},
-    )
+    return _render_page(user, "dashboard", "pages/dashboard.html")
 
 
 @router.get(
@@ -102,7 +208,7 @@ async def dashboard(
 async def user_card_partial(
     request: Request,
     user: Annotated[SessionData, Depends(get_current_user)],
-) -> HTMLResponse:
+) -> Response:
     """Return user card HTML fragment for HTMX swap.
 
     Args:
@@ -110,13 +216,14 @@ async def user_card_partial(
         user: Authenticated user session.
 
     Returns:
-        User card partial HTML (no base layout).
+        User card partial HTML (no base layout), or 304 if unchanged.
     """
-    return templates.TemplateResponse(
-        request,
+    html = render_cached(
+        ("user_card", _user_key(user)),
         "partials/user_card.html",
         {"user": user},
     )
+    return _etag_response(request, html)
 
 
 @router.get(
@@ -125,14 +232,12 @@ async def user_card_partial(
     include_in_schema=False,
 )
 async def error_page(
-    request: Request,
     status_code: int,
     user: Annotated[SessionData | None, Depends(get_optional_user)],
 ) -> HTMLResponse:
     """Render a generic error page.
 
     Args:
-        request: Incoming request.
         status_code: HTTP status code to display.
         user: Current user session, if any.
 
@@ -148,16 +253,21 @@ async def error_page(
     }
     message = messages.get(status_code, "An unexpected error occurred.")
 
-    return templates.TemplateResponse(
-        request,
-        "pages/error.html",
-        {
-            "user": user,
-            "status_code": status_code,
-            "message": message,
-        },
-        status_code=status_code,
-    )
+    context = {
+        "user": user,
+        "status_code": status_code,
+        "message": message,
+    }
+    # Only known codes are cached; arbitrary path values would churn the cache
+    if status_code in messages:
+        html = render_cached(
+            ("error", status_code, _user_key(user)),
+            "pages/error.html",
+            context,
+        )
+    else:
+        html = templates.get_template("pages/error.html").render(context)
+    return HTMLResponse(content=html, status_code=status_code)
 
 
 # ---------------------------------------------------------------------------
@@ -167,15 +277,10 @@ async def error_page(
 
 @router.get("/pages/locations", response_class=HTMLResponse, include_in_schema=False)
 async def locations_page(
-    request: Request,
     user: Annotated[SessionData, Depends(get_current_user)],
 ) -> HTMLResponse:
     """Render the location browser page."""
-    return templates.TemplateResponse(
-        request,
-        "pages/locations.html",
-        {"user": user, "active_page": "locations"},
-    )
+    return _render_page(user, "locations", "pages/locations.html")
 
 
 @router.get(
@@ -185,17 +290,16 @@ async def locations_page(
 )
 async def location_tree_partial(
     request: Request,
-    _user: Annotated[SessionData, Depends(get_current_user)],
+    _user_id: Annotated[str, Depends(get_current_user_id)],
     session: Annotated[Session, Depends(get_domain_session)],
     container: Annotated[Container, Depends(get_domain_container)],
 ) -> HTMLResponse:
     """Return the location tree partial (root locations)."""
-    svc = container.location_service(session)
-    roots = svc.get_children(parent_id=None)
+    tree = container.location_service(session).get_full_tree()
     return templates.TemplateResponse(
         request,
         "partials/location_tree.html",
-        {"locations": roots},
+        {"locations": tree.get(None, []), "tree": tree},
     )
 
 
@@ -206,7 +310,7 @@ async def location_tree_partial(
 )
 async def create_location_page(
     request: Request,
-    _user: Annotated[SessionData, Depends(get_current_user)],
+    _user_id: Annotated[str, Depends(get_current_user_id)],
     session: Annotated[Session, Depends(get_domain_session)],
     container: Annotated[Container, Depends(get_domain_container)],
     name: Annotated[str, Form()],
@@ -222,11 +326,11 @@ async def create_location_page(
     except (ValueError, RuntimeError):
         lg.opt(exception=True).warning("Location creation failed")
 
-    roots = svc.get_children(parent_id=None)
+    tree = svc.get_full_tree()
     return templates.TemplateResponse(
         request,
         "partials/location_tree.html",
-        {"locations": roots},
+        {"locations": tree.get(None, []), "tree": tree},
     )
 
 
@@ -238,7 +342,7 @@ async def create_location_page(
 async def location_detail_partial(
     request: Request,
     location_id: str,
-    _user: Annotated[SessionData, Depends(get_current_user)],
+    _user_id: Annotated[str, Depends(get_current_user_id)],
     session: Annotated[Session, Depends(get_domain_session)],
     container: Annotated[Container, Depends(get_domain_container)],
 ) -> HTMLResponse:
@@ -262,15 +366,10 @@ async def location_detail_partial(
 
 @router.get("/pages/things", response_class=HTMLResponse, include_in_schema=False)
 async def things_page(
-    request: Request,
     user: Annotated[SessionData, Depends(get_current_user)],
 ) -> HTMLResponse:
     """Render the thing registration page."""
-    return templates.TemplateResponse(
-        request,
-        "pages/things.html",
-        {"user": user, "active_page": "things"},
-    )
+    return _render_page(user, "things", "pages/things.html")
 
 
 @router.post(
@@ -280,7 +379,7 @@ async def things_page(
 )
 async def create_thing_page(
     request: Request,  # noqa: ARG001
-    _user: Annotated[SessionData, Depends(get_current_user)],
+    _user_id: Annotated[str, Depends(get_current_user_id)],
     session: Annotated[Session, Depends(get_domain_session)],
     container: Annotated[Container, Depends(get_domain_container)],
     name: Annotated[str, Form()],
@@ -290,37 +389,25 @@ async def create_thing_page(
     """Create a thing from form data and return a success message."""
     import uuid as _uuid  # noqa: PLC0415
 
-    thing_svc = container.thing_service(session)
-    location_path: str | None = None
-
-    if location_id:
-        loc_svc = container.location_service(session)
-        try:
-            loc = loc_svc.get_location(_uuid.UUID(location_id))
-            location_path = loc.path
-        except (ValueError, RuntimeError):
-            lg.opt(exception=True).warning("Location lookup failed")
+    from shelf_mind.application.errors import LocationNotFoundError  # noqa: PLC0415
 
+    thing_svc = container.thing_service(session)
     try:
-        thing = thing_svc.create_thing(
-            name=name,
-            description=description,
-            location_path=location_path,
-        )
-        # Place the thing if location was specified
         if location_id:
-            placement_svc = container.placement_service(session)
-            placement_svc.place_thing(
-                thing_id=thing.id,
+            thing = thing_svc.create_and_place(
+                name=name,
                 location_id=_uuid.UUID(location_id),
+                description=description,
             )
+        else:
+            thing = thing_svc.create_thing(name=name, description=description)
         html = (
             '<article class="message is-success">'
             '<div class="message-body">'
             f"Registered <strong>{thing.name}</strong> successfully."
             "</div></article>"
         )
-    except (ValueError, RuntimeError):
+    except (ValueError, RuntimeError, LocationNotFoundError):
         lg.opt(exception=True).warning("Thing creation failed")
         html = (
             '<article class="message is-danger">'
@@ -338,24 +425,23 @@ async def create_thing_page(
 )
 async def thing_preview_partial(
     request: Request,  # noqa: ARG001
-    _user: Annotated[SessionData, Depends(get_current_user)],
+    _user_id: Annotated[str, Depends(get_current_user_id)],
     container: Annotated[Container, Depends(get_domain_container)],
     name: Annotated[str, Form()],
     description: Annotated[str, Form()] = "",
 ) -> HTMLResponse:
-    """Return a metadata preview card for the given name/description."""
-    enricher = container.get_enricher()
-    meta = enricher.enrich(name, description or None)
-    html = (
-        '<div class="box">'
-        f"<p><strong>Category:</strong> {meta.category}</p>"
-        f"<p><strong>Material:</strong> {meta.material}</p>"
-        f"<p><strong>Room hint:</strong> {meta.room_hint}</p>"
-        f"<p><strong>Tags:</strong> {', '.join(meta.tags)}</p>"
-        f"<p><strong>Usage:</strong> {meta.usage_context}</p>"
-        "</div>"
-    )
-    return HTMLResponse(content=html)
+    """Return a metadata preview card for the given name/description.
+
+    Enrichment is deterministic, so cards are memoized in a dedicated
+    preview cache; misses await ``aenrich`` to keep the event loop free.
+    """
+    key = (name, description)
+    content = _preview_cache.get(key)
+    if content is None:
+        meta = await container.get_enricher().aenrich(name, description or None)
+        content = _render_preview(meta)
+        _preview_cache.set(key, content)
+    return HTMLResponse(content=content)
 
 
 @router.get(
@@ -364,23 +450,26 @@ async def thing_preview_partial(
     include_in_schema=False,
 )
 async def thing_location_options(
-    request: Request,  # noqa: ARG001
-    _user: Annotated[SessionData, Depends(get_current_user)],
+    request: Request,
+    _user_id: Annotated[str, Depends(get_current_user_id)],
     session: Annotated[Session, Depends(get_domain_session)],
     container: Annotated[Container, Depends(get_domain_container)],
     selected: Annotated[str, Query()] = "",
-) -> HTMLResponse:
+) -> Response:
     """Return select <option> elements for all locations.
 
+    The ETag is computed from the rendered options, so a 304 still runs the
+    location query and render; it only saves sending the body.
+
     Args:
         request: Incoming request.
-        _user: Authenticated user session.
+        _user_id: Authenticated user ID.
         session: Database session.
         container: Domain DI container.
         selected: UUID string of the currently selected location, if any.
 
     Returns:
-        HTML option elements for the location select.
+        HTML option elements for the location select, or 304 if unchanged.
     """
     svc = container.location_service(session)
     locations = svc.list_locations()
@@ -391,7 +480,7 @@ async def thing_location_options(
     for loc in locations:
         sel = "selected" if str(loc.id) == selected else ""
         options.append(f'<option value="{loc.id}" {sel}>{loc.path}</option>')
-    return HTMLResponse(content="\n".join(options))
+    return _etag_response(request, "\n".join(options))
 
 
 # ---------------------------------------------------------------------------
@@ -401,15 +490,10 @@ async def thing_location_options(
 
 @router.get("/pages/search", response_class=HTMLResponse, include_in_schema=False)
 async def search_page(
-    request: Request,
     user: Annotated[SessionData, Depends(get_current_user)],
 ) -> HTMLResponse:
     """Render the search page."""
-    return templates.TemplateResponse(
-        request,
-        "pages/search.html",
-        {"user": user, "active_page": "search"},
-    )
+    return _render_page(user, "search", "pages/search.html")
 
 
 @router.post(
@@ -419,7 +503,7 @@ async def search_page(
 )
 async def search_results_partial(
     request: Request,
-    _user: Annotated[SessionData, Depends(get_current_user)],
+    _user_id: Annotated[str, Depends(get_current_user_id)],
     container: Annotated[Container, Depends(get_domain_container)],
     q: Annotated[str, Form()],
     category: Annotated[str, Form()] = "",
@@ -430,7 +514,7 @@ async def search_results_partial(
 ) -> HTMLResponse:
     """Execute a text search and return results partial."""
     search_svc = container.search_service()
-    tags_list = [t.strip() for t in tags.split(",") if t.strip()] or None
+    tags_list = list(_parse_tags(tags)) or None
     results = search_svc.search_text(
         query=q,
         category_filter=category or None,
@@ -440,24 +524,12 @@ async def search_results_partial(
         limit=max(1, min(100, limit)),
     )
 
-    template_results = [
-        {
-            "name": r.name,
-            "description": r.description,
-            "score": r.score,
-            "category": r.category,
-            "location_path": r.location_path,
-            "tags": r.tags,
-        }
-        for r in results
-    ]
-
     return templates.TemplateResponse(
         request,
         "partials/search_results.html",
         {
-            "results": template_results,
-            "total": len(template_results),
+            "results": results,
+            "total": len(results),
             "query": q,
         },
     )
@@ -470,7 +542,7 @@ async def search_results_partial(
 )
 async def vision_search_results_partial(
     request: Request,
-    _user: Annotated[SessionData, Depends(get_current_user)],
+    _user_id: Annotated[str, Depends(get_current_user_id)],
     container: Annotated[Container, Depends(get_domain_container)],
     limit: Annotated[int, Form()] = 10,
 ) -> HTMLResponse:
@@ -481,7 +553,7 @@ async def vision_search_results_partial(
 
     Args:
         request: Incoming request (also used to read multipart).
-        _user: Authenticated user session.
+        _user_id: Authenticated user ID.
         container: Domain DI container.
         limit: Max results (1-100).
 
@@ -509,24 +581,12 @@ async def vision_search_results_partial(
         limit=max(1, min(100, limit)),
     )
 
-    template_results = [
-        {
-            "name": r.name,
-            "description": r.description,
-            "score": r.score,
-            "category": r.category,
-            "location_path": r.location_path,
-            "tags": r.tags,
-        }
-        for r in results
-    ]
-
     return templates.TemplateResponse(
         request,
         "partials/search_results.html",
         {
-            "results": template_results,
-            "total": len(template_results),
+            "results": results,
+            "total": len(results),
             "query": f"image ({_json.dumps(len(image_bytes))} bytes)",
         },
     )
@@ -544,7 +604,7 @@ async def vision_search_results_partial(
 )
 async def things_list_partial(
     request: Request,
-    _user: Annotated[SessionData, Depends(get_current_user)],
+    _user_id: Annotated[str, Depends(get_current_user_id)],
     session: Annotated[Session, Depends(get_domain_session)],
     container: Annotated[Container, Depends(get_domain_container)],
     q: Annotated[str, Form()] = "",
@@ -555,7 +615,7 @@ async def things_list_partial(
 
     Args:
         request: Incoming request.
-        _user: Authenticated user session.
+        _user_id: Authenticated user ID.
         session: Database session.
         container: Domain DI container.
         q: Optional name substring filter.
@@ -620,7 +680,7 @@ async def things_list_partial(
 async def thing_detail_partial(
     request: Request,
     thing_id: str,
-    _user: Annotated[SessionData, Depends(get_current_user)],
+    _user_id: Annotated[str, Depends(get_current_user_id)],
     session: Annotated[Session, Depends(get_domain_session)],
     container: Annotated[Container, Depends(get_domain_container)],
 ) -> HTMLResponse:
@@ -629,7 +689,7 @@ async def thing_detail_partial(
     Args:
         request: Incoming request.
         thing_id: UUID of the Thing.
-        _user: Authenticated user session.
+        _user_id: Authenticated user ID.
         session: Database session.
         container: Domain DI container.
 
@@ -687,7 +747,7 @@ async def thing_detail_partial(
 async def thing_edit_form_partial(
     request: Request,
     thing_id: str,
-    _user: Annotated[SessionData, Depends(get_current_user)],
+    _user_id: Annotated[str, Depends(get_current_user_id)],
     session: Annotated[Session, Depends(get_domain_session)],
     container: Annotated[Container, Depends(get_domain_container)],
 ) -> HTMLResponse:
@@ -696,7 +756,7 @@ async def thing_edit_form_partial(
     Args:
         request: Incoming request.
         thing_id: UUID of the Thing.
-        _user: Authenticated user session.
+        _user_id: Authenticated user ID.
         session: Database session.
         container: Domain DI container.
 
@@ -732,7 +792,7 @@ async def thing_edit_form_partial(
 async def update_thing_page(
     request: Request,
     thing_id: str,
-    _user: Annotated[SessionData, Depends(get_current_user)],
+    _user_id: Annotated[str, Depends(get_current_user_id)],
     session: Annotated[Session, Depends(get_domain_session)],
     container: Annotated[Container, Depends(get_domain_container)],
     name: Annotated[str, Form()],
@@ -747,7 +807,7 @@ async def update_thing_page(
     Args:
         request: Incoming request.
         thing_id: UUID of the Thing.
-        _user: Authenticated user session.
+        _user_id: Authenticated user ID.
         session: Database session.
         container: Domain DI container.
         name: New name.
@@ -793,7 +853,7 @@ async def update_thing_page(
     return await thing_detail_partial(
         request=request,
         thing_id=thing_id,
-        _user=_user,
+        _user_id=_user_id,
         session=session,
         container=container,
     )
@@ -807,7 +867,7 @@ async def update_thing_page(
 async def delete_thing_page(
     request: Request,
     thing_id: str,
-    _user: Annotated[SessionData, Depends(get_current_user)],
+    _user_id: Annotated[str, Depends(get_current_user_id)],
     session: Annotated[Session, Depends(get_domain_session)],
     container: Annotated[Container, Depends(get_domain_container)],
 ) -> HTMLResponse:
@@ -816,7 +876,7 @@ async def delete_thing_page(
     Args:
         request: Incoming request.
         thing_id: UUID of the Thing.
-        _user: Authenticated user session.
+        _user_id: Authenticated user ID.
         session: Database session.
         container: Domain DI container.
 
@@ -834,7 +894,7 @@ async def delete_thing_page(
 
     return await things_list_partial(
         request=request,
-        _user=_user,
+        _user_id=_user_id,
         session=session,
         container=container,
     )
@@ -853,7 +913,7 @@ async def delete_thing_page(
 async def rename_location_page(
     request: Request,
     location_id: str,
-    _user: Annotated[SessionData, Depends(get_current_user)],
+    _user_id: Annotated[str, Depends(get_current_user_id)],
     session: Annotated[Session, Depends(get_domain_session)],
     container: Annotated[Container, Depends(get_domain_container)],
     name: Annotated[str, Form()],
@@ -863,7 +923,7 @@ async def rename_location_page(
     Args:
         request: Incoming request.
         location_id: UUID of the Location.
-        _user: Authenticated user session.
+        _user_id: Authenticated user ID.
         session: Database session.
         container: Domain DI container.
         name: New name for the location.
@@ -880,8 +940,8 @@ async def rename_location_page(
         lg.opt(exception=True).warning("Location rename failed")
         loc = svc.get_location(_uuid.UUID(location_id))
 
-    children = svc.get_children(loc.id)
-    roots = svc.get_children(parent_id=None)
+    tree = svc.get_full_tree()
+    children = tree.get(loc.id, [])
 
     # Primary swap: detail panel; OOB swap: location tree
     detail_html = templates.get_template("partials/location_detail.html").render(
@@ -890,7 +950,7 @@ async def rename_location_page(
     tree_html = (
         '<div id="location-tree" hx-swap-oob="innerHTML">'
         + templates.get_template("partials/location_tree.html").render(
-            {"request": request, "locations": roots},
+            {"request": request, "locations": tree.get(None, []), "tree": tree},
         )
         + "</div>"
     )
@@ -905,7 +965,7 @@ async def rename_location_page(
 async def delete_location_page(
     request: Request,
     location_id: str,
-    _user: Annotated[SessionData, Depends(get_current_user)],
+    _user_id: Annotated[str, Depends(get_current_user_id)],
     session: Annotated[Session, Depends(get_domain_session)],
     container: Annotated[Container, Depends(get_domain_container)],
     force: Annotated[str, Form()] = "",
@@ -915,7 +975,7 @@ async def delete_location_page(
     Args:
         request: Incoming request.
         location_id: UUID of the Location.
-        _user: Authenticated user session.
+        _user_id: Authenticated user ID.
         session: Database session.
         container: Domain DI container.
         force: If "1", force-delete even when Things are present.
@@ -953,8 +1013,8 @@ async def delete_location_page(
         lg.opt(exception=True).warning("Location deletion failed")
         error_html = '<p class="has-text-danger">Deletion failed.</p>'
 
-    roots = svc.get_children(parent_id=None)
+    tree = svc.get_full_tree()
     tree_html = templates.get_template("partials/location_tree.html").render(
-        {"request": request, "locations": roots},
+        {"request": request, "locations": tree.get(None, []), "tree": tree},
     )
     return HTMLResponse(content=tree_html + error_html)
@@ -1,10 +1,13 @@
-"""Authentication-related Pydantic schemas."""
+"""Authentication-related schemas (Pydantic models and session dataclass)."""
 
+from dataclasses import dataclass
 from datetime import datetime
 
 from pydantic import BaseModel
+from pydantic import ConfigDict
 from pydantic import EmailStr
 from pydantic import Field
+from pydantic import TypeAdapter
 
 
 class GoogleUserInfo(BaseModel):
@@ -19,21 +22,64 @@ class GoogleUserInfo(BaseModel):
     family_name: str | None = Field(default=None, description="Last name")
 
 
-class SessionData(BaseModel):
-    """Session data stored server-side."""
+@dataclass(slots=True, frozen=True)
+class SessionData:
+    """Session data stored server-side.
+
+    A slotted dataclass rather than a pydantic model, so building one from
+    trusted server-side state runs no validators; user input is validated
+    earlier, as ``GoogleUserInfo``. ``from_json`` does validate every field,
+    since pydantic-core parses the stored ISO timestamps back into datetimes
+    in the same pass.
+
+    Attributes:
+        session_id: Unique session identifier.
+        user_id: Google user ID (sub).
+        email: User email.
+        name: User display name.
+        created_at: Session creation time.
+        expires_at: Session expiration time.
+        picture: Profile picture URL.
+    """
+
+    session_id: str
+    user_id: str
+    email: str
+    name: str
+    created_at: datetime
+    expires_at: datetime
+    picture: str | None = None
+
+    def to_json(self) -> str:
+        """Serialize to a JSON string with ISO-8601 timestamps.
 
-    session_id: str = Field(description="Unique session identifier")
-    user_id: str = Field(description="Google user ID (sub)")
-    email: str = Field(description="User email")
-    name: str = Field(description="User display name")
-    picture: str | None = Field(default=None, description="Profile picture URL")
-    created_at: datetime = Field(description="Session creation time")
-    expires_at: datetime = Field(description="Session expiration time")
+        Returns:
+            JSON representation.
+        """
+        return _SESSION_DATA_ADAPTER.dump_json(self).decode()
+
+    @classmethod
+    def from_json(cls, raw: str) -> "SessionData":
+        """Deserialize from the output of ``to_json``.
+
+        Args:
+            raw: JSON representation.
+
+        Returns:
+            SessionData instance.
+        """
+        return _SESSION_DATA_ADAPTER.validate_json(raw)
+
+
+# JSON (de)serialization runs in pydantic-core, without an intermediate dict
+_SESSION_DATA_ADAPTER = TypeAdapter(SessionData)
 
 
 class LoginResponse(BaseModel):
     """Response after successful login."""
 
+    model_config = ConfigDict(frozen=True)
+
     message: str = Field(default="Login successful")
     user: "UserResponse" = Field(description="Authenticated user info")
 
@@ -41,6 +87,8 @@ class LoginResponse(BaseModel):
 class UserResponse(BaseModel):
     """Public user information response."""
 
+    model_config = ConfigDict(frozen=True)
+
     id: str = Field(description="User ID")
     email: str = Field(description="User email")
     name: str = Field(description="User display name")
@@ -67,11 +115,15 @@ class UserResponse(BaseModel):
 class LogoutResponse(BaseModel):
     """Response after logout."""
 
+    model_config = ConfigDict(frozen=True)
+
     message: str = Field(default="Logout successful")
 
 
 class AuthURLResponse(BaseModel):
     """Response containing OAuth authorization URL."""
 
+    model_config = ConfigDict(frozen=True)
+
     auth_url: str = Field(description="Google OAuth authorization URL")
     state: str = Field(description="State parameter for CSRF protection")
@@ -3,12 +3,15 @@
 from datetime import datetime
 
 from pydantic import BaseModel
+from pydantic import ConfigDict
 from pydantic import Field
 
 
 class HealthResponse(BaseModel):
     """Health check response."""
 
+    model_config = ConfigDict(frozen=True)
+
     status: str = Field(description="Health status (healthy/unhealthy)")
     version: str = Field(description="Application version")
     timestamp: datetime = Field(description="Response timestamp")
@@ -17,6 +20,8 @@ class HealthResponse(BaseModel):
 class ReadinessResponse(BaseModel):
     """Readiness probe response."""
 
+    model_config = ConfigDict(frozen=True)
+
     status: str = Field(description="Ready status (ready/not_ready)")
     checks: dict[str, bool] = Field(
         default_factory=dict,
@@ -27,6 +32,8 @@ class ReadinessResponse(BaseModel):
 class ErrorResponse(BaseModel):
     """Standard error response."""
 
+    model_config = ConfigDict(frozen=True)
+
     detail: str = Field(description="Error message")
     error_code: str | None = Field(default=None, description="Application error code")
     request_id: str | None = Field(default=None, description="Request ID for tracking")
@@ -35,6 +42,8 @@ class ErrorResponse(BaseModel):
 class MessageResponse(BaseModel):
     """Simple message response."""
 
+    model_config = ConfigDict(frozen=True)
+
     message: str = Field(description="Response message")
 
 
@@ -53,6 +62,8 @@ class PaginationParams(BaseModel):
 class PaginatedResponse(BaseModel):
     """Base response for paginated data."""
 
+    model_config = ConfigDict(frozen=True)
+
     total: int = Field(description="Total number of items")
     page: int = Field(description="Current page number")
     page_size: int = Field(description="Items per page")
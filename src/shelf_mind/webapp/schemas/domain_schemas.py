@@ -4,6 +4,7 @@ from datetime import datetime
 import uuid
 
 from pydantic import BaseModel
+from pydantic import ConfigDict
 from pydantic import Field
 
 # -- Location schemas --
@@ -48,6 +49,8 @@ class LocationResponse(BaseModel):
         created_at: Creation timestamp.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     id: uuid.UUID
     name: str
     parent_id: uuid.UUID | None
@@ -65,6 +68,8 @@ class LocationTreeResponse(BaseModel):
         children_count: Number of direct children.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     id: uuid.UUID
     name: str
     path: str
@@ -115,6 +120,8 @@ class ThingResponse(BaseModel):
         updated_at: Last update timestamp.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     id: uuid.UUID
     name: str
     description: str
@@ -134,6 +141,8 @@ class ThingListResponse(BaseModel):
         limit: Page size.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     items: list[ThingResponse]
     total: int
     offset: int
@@ -166,6 +175,8 @@ class PlacementResponse(BaseModel):
         active: Whether this is current.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     id: uuid.UUID
     thing_id: uuid.UUID
     location_id: uuid.UUID
@@ -209,6 +220,8 @@ class SearchResultResponse(BaseModel):
         score: Confidence score.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     thing_id: uuid.UUID
     name: str
     description: str = ""
@@ -227,6 +240,8 @@ class SearchResponse(BaseModel):
         query: Original query.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     results: list[SearchResultResponse]
     total: int
     query: str
@@ -274,6 +289,8 @@ class BatchResultResponse(BaseModel):
         errors: List of error messages for failed items.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     succeeded: int
     failed: int
     errors: list[str] = []
@@ -1,14 +1,20 @@
 """Authentication service for Google OAuth and session management."""
 
+from abc import ABC
+from abc import abstractmethod
+import asyncio
+import base64
 from datetime import UTC
 from datetime import datetime
 import json
 from pathlib import Path
 import sqlite3
+import threading
 from urllib.parse import urlencode
 
 import httpx
 from loguru import logger as lg
+from pydantic import ValidationError
 
 from shelf_mind.config.webapp import GoogleOAuthConfig
 from shelf_mind.config.webapp import SessionConfig
@@ -16,6 +22,7 @@ from shelf_mind.webapp.core.security import generate_session_id
 from shelf_mind.webapp.core.security import generate_state_token
 from shelf_mind.webapp.core.security import get_expiration_time
 from shelf_mind.webapp.core.security import is_expired
+from shelf_mind.webapp.core.security import utc_timestamp
 from shelf_mind.webapp.schemas.auth_schemas import GoogleUserInfo
 from shelf_mind.webapp.schemas.auth_schemas import SessionData
 
@@ -24,28 +31,54 @@ GOOGLE_AUTH_URL = "https://accounts.google.com/o/oauth2/v2/auth"
 GOOGLE_TOKEN_URL = "https://oauth2.googleapis.com/token"  # noqa: S105
 GOOGLE_USERINFO_URL = "https://www.googleapis.com/oauth2/v3/userinfo"
 
+# Maximum number of expired sessions deleted per SQLite statement
+_CLEANUP_BATCH_SIZE = 1000
 
-class SessionStore:
-    """In-memory session storage.
+# Keyed by the random session id, so a WITHOUT ROWID table stores each row
+# directly in the primary-key B-tree instead of behind a separate rowid.
+# user_id and email are duplicated out of the JSON blob so authorization
+# checks can read them without deserializing the full session.
+_SESSIONS_TABLE_SQL = """
+CREATE TABLE {name} (
+    session_id TEXT PRIMARY KEY,
+    user_id TEXT NOT NULL,
+    email TEXT NOT NULL,
+    data TEXT NOT NULL,
+    expires_at INTEGER NOT NULL
+) WITHOUT ROWID
+"""
 
-    Suitable for development and testing. For production, use
-    SqliteSessionStore for persistent sessions.
+
+class BaseSessionStore(ABC):
+    """Session storage interface with in-memory OAuth state tokens.
+
+    Subclasses persist sessions; state tokens are short-lived and always
+    kept in a bounded in-memory map. When the map is full, expired tokens
+    are purged and, if still full, the oldest token is evicted. This caps
+    memory even if the login endpoint is flooded with state-token requests.
+
+    Args:
+        max_state_tokens: Maximum number of pending OAuth state tokens.
     """
 
-    def __init__(self) -> None:
-        """Initialize empty session store."""
-        self._sessions: dict[str, SessionData] = {}
+    def __init__(self, max_state_tokens: int = 10_000) -> None:
+        """Initialize with an empty state-token map.
+
+        Args:
+            max_state_tokens: Maximum number of pending OAuth state tokens.
+        """
         self._state_tokens: dict[str, datetime] = {}
+        self._max_state_tokens = max_state_tokens
 
+    @abstractmethod
     def create_session(self, session_data: SessionData) -> None:
         """Store a new session.
 
         Args:
             session_data: Session data to store.
         """
-        self._sessions[session_data.session_id] = session_data
-        lg.debug(f"Created session for user {session_data.email}")
 
+    @abstractmethod
     def get_session(self, session_id: str) -> SessionData | None:
         """Retrieve a session by ID.
 
@@ -55,21 +88,36 @@ class SessionStore:
         Returns:
             SessionData if found and not expired, None otherwise.
         """
-        session = self._sessions.get(session_id)
-        if session and is_expired(session.expires_at):
-            self.delete_session(session_id)
+
+    def get_session_identity(self, session_id: str) -> tuple[str, str] | None:
+        """Retrieve only the user id and email of a session.
+
+        Args:
+            session_id: Session identifier.
+
+        Returns:
+            ``(user_id, email)`` if found and not expired, None otherwise.
+        """
+        session = self.get_session(session_id)
+        if session is None:
             return None
-        return session
+        return session.user_id, session.email
 
+    @abstractmethod
     def delete_session(self, session_id: str) -> None:
         """Delete a session.
 
         Args:
             session_id: Session identifier to delete.
         """
-        if session_id in self._sessions:
-            del self._sessions[session_id]
-            lg.debug(f"Deleted session {session_id[:8]}...")
+
+    @abstractmethod
+    def cleanup_expired(self) -> int:
+        """Remove expired sessions and state tokens.
+
+        Returns:
+            Number of removed items.
+        """
 
     def store_state_token(self, state: str, ttl_seconds: int = 600) -> None:
         """Store OAuth state token for CSRF protection.
@@ -78,6 +126,11 @@ class SessionStore:
             state: State token to store.
             ttl_seconds: Time-to-live in seconds.
         """
+        if len(self._state_tokens) >= self._max_state_tokens:
+            self._cleanup_state_tokens(datetime.now(UTC))
+            if len(self._state_tokens) >= self._max_state_tokens:
+                # Dicts keep insertion order, so the first key is the oldest
+                self._state_tokens.pop(next(iter(self._state_tokens)))
         self._state_tokens[state] = get_expiration_time(ttl_seconds)
 
     def validate_state_token(self, state: str) -> bool:
@@ -94,6 +147,125 @@ class SessionStore:
             return False
         return not is_expired(expiration)
 
+    def _cleanup_state_tokens(self, now: datetime) -> int:
+        """Remove expired OAuth state tokens.
+
+        Args:
+            now: Reference time for expiry.
+
+        Returns:
+            Number of removed state tokens.
+        """
+        expired_states = [
+            state for state, exp in self._state_tokens.items() if now > exp
+        ]
+        if len(expired_states) > len(self._state_tokens) // 2:
+            self._state_tokens = {
+                state: exp for state, exp in self._state_tokens.items() if now <= exp
+            }
+        else:
+            for state in expired_states:
+                self._state_tokens.pop(state, None)
+        return len(expired_states)
+
+    async def run_cleanup_loop(self, interval_seconds: int = 3600) -> None:
+        """Periodically purge expired sessions until cancelled.
+
+        Started once at application startup so that cleanup never runs on
+        the request path.
+
+        Args:
+            interval_seconds: Seconds to wait between purges.
+        """
+        while True:
+            await asyncio.sleep(interval_seconds)
+            try:
+                await self.acleanup_expired()
+            except Exception:  # noqa: BLE001
+                lg.exception("Session cleanup failed")
+
+    async def acleanup_expired(self) -> int:
+        """Remove expired entries without blocking the event loop.
+
+        The default runs :meth:`cleanup_expired` inline, which is fine for
+        stores that only touch in-memory dicts.
+
+        Returns:
+            Number of removed items.
+        """
+        return self.cleanup_expired()
+
+    def close(self) -> None:  # noqa: B027
+        """Release any resources held by the store (no-op by default)."""
+
+
+class SessionStore(BaseSessionStore):
+    """In-memory session storage.
+
+    Suitable for development and testing. For production, use
+    SqliteSessionStore for persistent sessions.
+
+    The session map is bounded like the state-token map: when full,
+    expired sessions are purged and, if still full, the oldest is evicted.
+
+    Args:
+        max_sessions: Maximum number of in-memory sessions.
+        max_state_tokens: Maximum number of pending OAuth state tokens.
+    """
+
+    def __init__(
+        self,
+        max_sessions: int = 10_000,
+        max_state_tokens: int = 10_000,
+    ) -> None:
+        """Initialize empty session store.
+
+        Args:
+            max_sessions: Maximum number of in-memory sessions.
+            max_state_tokens: Maximum number of pending OAuth state tokens.
+        """
+        super().__init__(max_state_tokens=max_state_tokens)
+        self._sessions: dict[str, SessionData] = {}
+        self._max_sessions = max_sessions
+
+    def create_session(self, session_data: SessionData) -> None:
+        """Store a new session.
+
+        Args:
+            session_data: Session data to store.
+        """
+        if len(self._sessions) >= self._max_sessions:
+            self.cleanup_expired()
+            if len(self._sessions) >= self._max_sessions:
+                self._sessions.pop(next(iter(self._sessions)))
+        self._sessions[session_data.session_id] = session_data
+        lg.debug(f"Created session for user {session_data.email}")
+
+    def get_session(self, session_id: str) -> SessionData | None:
+        """Retrieve a session by ID.
+
+        Args:
+            session_id: Session identifier.
+
+        Returns:
+            SessionData if found and not expired, None otherwise.
+        """
+        session = self._sessions.get(session_id)
+        if session and is_expired(session.expires_at):
+            self.delete_session(session_id)
+            return None
+        return session
+
+    def delete_session(self, session_id: str) -> None:
+        """Delete a session.
+
+        Args:
+            session_id: Session identifier to delete.
+        """
+        if session_id in self._sessions:
+            del self._sessions[session_id]
+            lg.debug(f"Deleted session {session_id[:8]}...")
+
     def cleanup_expired(self) -> int:
         """Remove expired sessions and state tokens.
 
@@ -101,36 +273,36 @@ class SessionStore:
             Number of removed items.
         """
         now = datetime.now(UTC)
-        removed = 0
-
-        # Cleanup sessions
         expired_sessions = [
-            sid for sid, data in self._sessions.items() if is_expired(data.expires_at)
+            sid for sid, data in self._sessions.items() if now > data.expires_at
         ]
-        for sid in expired_sessions:
-            del self._sessions[sid]
-            removed += 1
-
-        # Cleanup state tokens
-        expired_states = [
-            state for state, exp in self._state_tokens.items() if now > exp
-        ]
-        for state in expired_states:
-            del self._state_tokens[state]
-            removed += 1
-
+        if len(expired_sessions) > len(self._sessions) // 2:
+            # Rebuilding is cheaper than many deletes that leave the dict sparse
+            self._sessions = {
+                sid: data
+                for sid, data in self._sessions.items()
+                if now <= data.expires_at
+            }
+        else:
+            for sid in expired_sessions:
+                self._sessions.pop(sid, None)
+
+        removed = len(expired_sessions) + self._cleanup_state_tokens(now)
         if removed > 0:
             lg.debug(f"Cleaned up {removed} expired sessions/tokens")
 
         return removed
 
 
-class SqliteSessionStore(SessionStore):
+class SqliteSessionStore(BaseSessionStore):
     """SQLite-backed session storage for persistent sessions across restarts.
 
-    Extends SessionStore to persist sessions in a SQLite database file
-    while keeping the same API. State tokens remain in-memory since they
-    are short-lived.
+    Persists sessions in a SQLite database file with the same API as
+    SessionStore; only state tokens, which are short-lived, stay in memory.
+
+    A single long-lived connection in autocommit mode is shared by all
+    operations and serialized with a lock; WAL journaling keeps writes
+    cheap and lets external readers proceed concurrently.
 
     Args:
         db_path: Path to the SQLite database file.
@@ -145,29 +317,86 @@ class SqliteSessionStore(SessionStore):
         super().__init__()
         Path(db_path).parent.mkdir(parents=True, exist_ok=True)
         self._db_path = db_path
+        self._lock = threading.Lock()
+        # Statements are constant strings, so with one long-lived connection
+        # each is prepared once and then served from sqlite3's statement cache
+        self._conn = sqlite3.connect(
+            db_path,
+            check_same_thread=False,
+            isolation_level=None,
+        )
         self._init_db()
 
-    def _get_conn(self) -> sqlite3.Connection:
-        """Get a database connection.
+    def _init_db(self) -> None:
+        """Apply connection pragmas and create the sessions table.
 
-        Returns:
-            SQLite connection.
+        ``expires_at`` is stored as integer Unix epoch seconds and indexed,
+        so ``cleanup_expired`` is a cheap integer range scan rather than a
+        full table scan.
         """
-        return sqlite3.connect(self._db_path)
-
-    def _init_db(self) -> None:
-        """Create the sessions table if it does not exist."""
-        with self._get_conn() as conn:
-            conn.execute(
-                """
-                CREATE TABLE IF NOT EXISTS sessions (
-                    session_id TEXT PRIMARY KEY,
-                    data TEXT NOT NULL,
-                    expires_at TEXT NOT NULL
-                )
-                """,
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute("PRAGMA temp_store=MEMORY")
+            self._conn.execute("PRAGMA busy_timeout=5000")
+            self._migrate_legacy_schema()
+            self._conn.execute(
+                _SESSIONS_TABLE_SQL.format(name="IF NOT EXISTS sessions"),
             )
-            conn.commit()
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_sessions_expires_at "
+                "ON sessions(expires_at)",
+            )
+
+    def _migrate_legacy_schema(self) -> None:
+        """Rebuild a sessions table created with an older schema.
+
+        Older databases stored ``expires_at`` as ISO-8601 text, used a
+        regular rowid table and kept ``user_id``/``email`` only inside the
+        JSON blob; all are converted in a single copy.
+        Must be called with the lock held.
+        """
+        row = self._conn.execute(
+            "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'sessions'",
+        ).fetchone()
+        if row is None:
+            return
+        columns = {
+            info[1]: info[2]
+            for info in self._conn.execute("PRAGMA table_info(sessions)")
+        }
+        if "WITHOUT ROWID" in row[0].upper() and "user_id" in columns:
+            return
+        expires_expr = (
+            "expires_at"
+            if columns["expires_at"].upper() == "INTEGER"
+            else "CAST(strftime('%s', expires_at) AS INTEGER)"
+        )
+        lg.info("Migrating sessions table to the current schema")
+        # Only module constants and a fixed column expression are interpolated
+        self._conn.executescript(
+            f"""
+            BEGIN;
+            DROP INDEX IF EXISTS idx_sessions_expires_at;
+            ALTER TABLE sessions RENAME TO sessions_legacy;
+            {_SESSIONS_TABLE_SQL.format(name="sessions")};
+            INSERT INTO sessions (session_id, user_id, email, data, expires_at)
+                SELECT
+                    session_id,
+                    json_extract(data, '$.user_id'),
+                    json_extract(data, '$.email'),
+                    data,
+                    {expires_expr}
+                FROM sessions_legacy;
+            DROP TABLE sessions_legacy;
+            COMMIT;
+            """,  # noqa: S608
+        )
+
+    def close(self) -> None:
+        """Close the underlying SQLite connection."""
+        with self._lock:
+            self._conn.close()
 
     def create_session(self, session_data: SessionData) -> None:
         """Store a new session in SQLite.
@@ -175,17 +404,19 @@ class SqliteSessionStore(SessionStore):
         Args:
             session_data: Session data to store.
         """
-        with self._get_conn() as conn:
-            conn.execute(
-                "INSERT OR REPLACE INTO sessions (session_id, data, expires_at) "
-                "VALUES (?, ?, ?)",
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO sessions "
+                "(session_id, user_id, email, data, expires_at) "
+                "VALUES (?, ?, ?, ?, ?)",
                 (
                     session_data.session_id,
-                    session_data.model_dump_json(),
-                    session_data.expires_at.isoformat(),
+                    session_data.user_id,
+                    session_data.email,
+                    session_data.to_json(),
+                    int(session_data.expires_at.timestamp()),
                 ),
             )
-            conn.commit()
         lg.debug(f"Created persistent session for user {session_data.email}")
 
     def get_session(self, session_id: str) -> SessionData | None:
@@ -197,23 +428,59 @@ class SqliteSessionStore(SessionStore):
         Returns:
             SessionData if found and not expired, None otherwise.
         """
-        with self._get_conn() as conn:
-            row = conn.execute(
-                "SELECT data, expires_at FROM sessions WHERE session_id = ?",
-                (session_id,),
+        now_ts = utc_timestamp()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT data FROM sessions WHERE session_id = ? AND expires_at >= ?",
+                (session_id, now_ts),
             ).fetchone()
+            if row is None:
+                self._reap_expired(session_id, now_ts)
+                return None
 
-        if row is None:
-            return None
+        return SessionData.from_json(row[0])
 
-        data_json, expires_at_str = row
-        expires_at = datetime.fromisoformat(expires_at_str)
+    def get_session_identity(self, session_id: str) -> tuple[str, str] | None:
+        """Retrieve only the user id and email of a session from SQLite.
 
-        if is_expired(expires_at):
-            self.delete_session(session_id)
-            return None
+        Reads the dedicated columns and skips deserializing the JSON blob.
+
+        Args:
+            session_id: Session identifier.
+
+        Returns:
+            ``(user_id, email)`` if found and not expired, None otherwise.
+        """
+        now_ts = utc_timestamp()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT user_id, email FROM sessions "
+                "WHERE session_id = ? AND expires_at >= ?",
+                (session_id, now_ts),
+            ).fetchone()
+            if row is None:
+                self._reap_expired(session_id, now_ts)
+                return None
+
+        return row[0], row[1]
+
+    def _reap_expired(self, session_id: str, now_ts: float) -> None:
+        """Delete a session if it exists and has expired.
+
+        Called after a lookup that filtered on expiry found nothing, so a
+        valid session costs a single SELECT. Must be called with the lock
+        held.
 
-        return SessionData(**json.loads(data_json))
+        Args:
+            session_id: Session identifier.
+            now_ts: Reference time in epoch seconds.
+        """
+        cursor = self._conn.execute(
+            "DELETE FROM sessions WHERE session_id = ? AND expires_at < ?",
+            (session_id, now_ts),
+        )
+        if cursor.rowcount:
+            lg.debug(f"Deleted expired session {session_id[:8]}...")
 
     def delete_session(self, session_id: str) -> None:
         """Delete a session from SQLite.
@@ -221,12 +488,11 @@ class SqliteSessionStore(SessionStore):
         Args:
             session_id: Session identifier to delete.
         """
-        with self._get_conn() as conn:
-            conn.execute(
+        with self._lock:
+            self._conn.execute(
                 "DELETE FROM sessions WHERE session_id = ?",
                 (session_id,),
             )
-            conn.commit()
         lg.debug(f"Deleted persistent session {session_id[:8]}...")
 
     def cleanup_expired(self) -> int:
@@ -235,38 +501,74 @@ class SqliteSessionStore(SessionStore):
         Returns:
             Number of removed items.
         """
-        now_iso = datetime.now(UTC).isoformat()
-        with self._get_conn() as conn:
-            cursor = conn.execute(
-                "DELETE FROM sessions WHERE expires_at < ?",
-                (now_iso,),
-            )
-            removed = cursor.rowcount
-            conn.commit()
+        now = datetime.now(UTC)
+        removed = self._delete_expired_sessions(int(now.timestamp()))
+        # Also clean up in-memory state tokens, against the same reference time
+        removed += self._cleanup_state_tokens(now)
+
+        if removed > 0:
+            lg.debug(f"Cleaned up {removed} expired sessions/tokens")
+
+        return removed
+
+    async def acleanup_expired(self) -> int:
+        """Remove expired entries, running the SQLite deletes in a worker thread.
 
-        # Also clean up in-memory state tokens
+        The connection is serialised by ``self._lock``, so the deletes are safe
+        off the event loop. State tokens are plain dicts shared with request
+        handlers, so they are still purged on the loop.
+
+        Returns:
+            Number of removed items.
+        """
         now = datetime.now(UTC)
-        expired_states = [
-            state for state, exp in self._state_tokens.items() if now > exp
-        ]
-        for state in expired_states:
-            del self._state_tokens[state]
-            removed += 1
+        removed = await asyncio.to_thread(
+            self._delete_expired_sessions,
+            int(now.timestamp()),
+        )
+        removed += self._cleanup_state_tokens(now)
 
         if removed > 0:
             lg.debug(f"Cleaned up {removed} expired sessions/tokens")
 
         return removed
 
+    def _delete_expired_sessions(self, now_ts: int) -> int:
+        """Delete sessions that expired before ``now_ts``.
+
+        Args:
+            now_ts: Reference UTC timestamp in seconds.
+
+        Returns:
+            Number of deleted sessions.
+        """
+        removed = 0
+        while True:
+            # Delete in bounded batches, releasing the lock in between
+            with self._lock:
+                cursor = self._conn.execute(
+                    "DELETE FROM sessions WHERE session_id IN ("
+                    "SELECT session_id FROM sessions WHERE expires_at < ? LIMIT ?)",
+                    (now_ts, _CLEANUP_BATCH_SIZE),
+                )
+            removed += cursor.rowcount
+            if cursor.rowcount < _CLEANUP_BATCH_SIZE:
+                return removed
+
 
 class GoogleAuthService:
-    """Service for Google OAuth 2.0 authentication."""
+    """Service for Google OAuth 2.0 authentication.
+
+    A single pooled ``httpx.AsyncClient`` is shared by all OAuth calls so
+    keep-alive connections to Google are reused across logins; call
+    ``aclose`` on shutdown to release it.
+    """
 
     def __init__(
         self,
         oauth_config: GoogleOAuthConfig,
         session_config: SessionConfig,
-        session_store: SessionStore,
+        session_store: BaseSessionStore,
     ) -> None:
         """Initialize auth service.
 
@@ -278,6 +580,26 @@ class GoogleAuthService:
         self.oauth_config = oauth_config
         self.session_config = session_config
         self.session_store = session_store
+        self._http = httpx.AsyncClient(
+            timeout=10.0,
+            limits=httpx.Limits(max_keepalive_connections=10),
+        )
+        # Only the state token varies per request; encode the rest once
+        auth_params = urlencode(
+            {
+                "client_id": oauth_config.client_id,
+                "redirect_uri": oauth_config.redirect_uri,
+                "response_type": "code",
+                "scope": " ".join(oauth_config.scopes),
+                "access_type": "offline",
+                "prompt": "select_account",
+            },
+        )
+        self._auth_url_prefix = f"{GOOGLE_AUTH_URL}?{auth_params}"
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP client."""
+        await self._http.aclose()
 
     def get_authorization_url(self) -> tuple[str, str]:
         """Generate Google OAuth authorization URL.
@@ -288,17 +610,8 @@ class GoogleAuthService:
         state = generate_state_token()
         self.session_store.store_state_token(state)
 
-        params = {
-            "client_id": self.oauth_config.client_id,
-            "redirect_uri": self.oauth_config.redirect_uri,
-            "response_type": "code",
-            "scope": " ".join(self.oauth_config.scopes),
-            "state": state,
-            "access_type": "offline",
-            "prompt": "select_account",
-        }
-
-        auth_url = f"{GOOGLE_AUTH_URL}?{urlencode(params)}"
+        # State tokens are hex, so they need no URL quoting
+        auth_url = f"{self._auth_url_prefix}&state={state}"
         return auth_url, state
 
     def validate_state(self, state: str) -> bool:
@@ -332,10 +645,9 @@ class GoogleAuthService:
             "redirect_uri": self.oauth_config.redirect_uri,
         }
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(GOOGLE_TOKEN_URL, data=data)
-            response.raise_for_status()
-            return response.json()
+        response = await self._http.post(GOOGLE_TOKEN_URL, data=data)
+        response.raise_for_status()
+        return response.json()
 
     async def get_user_info(self, access_token: str) -> GoogleUserInfo:
         """Get user information from Google.
@@ -349,13 +661,41 @@ class GoogleAuthService:
         Raises:
             httpx.HTTPStatusError: If API call fails.
         """
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                GOOGLE_USERINFO_URL,
-                headers={"Authorization": f"Bearer {access_token}"},
-            )
-            response.raise_for_status()
-            return GoogleUserInfo(**response.json())
+        response = await self._http.get(
+            GOOGLE_USERINFO_URL,
+            headers={"Authorization": f"Bearer {access_token}"},
+        )
+        response.raise_for_status()
+        return GoogleUserInfo(**response.json())
+
+    def _user_info_from_id_token(self, id_token: str | None) -> GoogleUserInfo | None:
+        """Read user info from the ID token returned by the token endpoint.
+
+        The token comes straight from Google over TLS in exchange for our
+        client secret, so its signature is not re-verified here; only the
+        audience is checked.
+
+        Args:
+            id_token: Encoded JWT from the token response, if any.
+
+        Returns:
+            GoogleUserInfo if the token holds the required claims, else None.
+        """
+        if not id_token:
+            return None
+        try:
+            payload = id_token.split(".")[1]
+            padded = payload + "=" * (-len(payload) % 4)
+            claims = json.loads(base64.urlsafe_b64decode(padded))
+            if (
+                not isinstance(claims, dict)
+                or claims.get("aud") != self.oauth_config.client_id
+            ):
+                return None
+            return GoogleUserInfo.model_validate(claims)
+        except (IndexError, ValueError, ValidationError):
+            lg.debug("Unusable ID token, falling back to userinfo endpoint")
+            return None
 
     async def authenticate(self, code: str, state: str) -> SessionData:
         """Complete authentication flow.
@@ -380,8 +720,11 @@ class GoogleAuthService:
         tokens = await self.exchange_code_for_tokens(code)
         access_token = tokens["access_token"]
 
-        # Get user info
-        user_info = await self.get_user_info(access_token)
+        # The ID token already carries the profile claims; fall back to the
+        # userinfo endpoint only when it is missing or incomplete
+        user_info = self._user_info_from_id_token(tokens.get("id_token"))
+        if user_info is None:
+            user_info = await self.get_user_info(access_token)
 
         # Create session
         session = self.create_session(user_info)
@@ -23,6 +23,8 @@ class UserService:
         """
         # In-memory user store (placeholder for database)
         self._users: dict[str, UserResponse] = {}
+        # Email -> user id, kept in sync with _users for O(1) lookups
+        self._email_index: dict[str, str] = {}
 
     def get_or_create_user(self, google_user_info: GoogleUserInfo) -> UserResponse:
         """Get existing user or create new one from Google info.
@@ -35,24 +37,28 @@ class UserService:
         """
         user_id = google_user_info.sub
 
-        if user_id in self._users:
-            lg.debug(f"Found existing user: {google_user_info.email}")
-            # Update user info from Google (may have changed)
-            self._users[user_id] = UserResponse(
-                id=user_id,
-                email=google_user_info.email,
-                name=google_user_info.name,
-                picture=google_user_info.picture,
-            )
+        existing = self._users.get(user_id)
+        if existing is not None:
+            if (
+                existing.email == google_user_info.email
+                and existing.name == google_user_info.name
+                and existing.picture == google_user_info.picture
+            ):
+                # Common re-login case: nothing changed, reuse the model
+                return existing
+            lg.debug(f"Updating existing user: {google_user_info.email}")
+            if existing.email != google_user_info.email:
+                self._email_index.pop(existing.email, None)
         else:
             lg.info(f"Creating new user: {google_user_info.email}")
-            self._users[user_id] = UserResponse(
-                id=user_id,
-                email=google_user_info.email,
-                name=google_user_info.name,
-                picture=google_user_info.picture,
-            )
 
+        self._users[user_id] = UserResponse(
+            id=user_id,
+            email=google_user_info.email,
+            name=google_user_info.name,
+            picture=google_user_info.picture,
+        )
+        self._email_index[google_user_info.email] = user_id
         return self._users[user_id]
 
     def get_user_by_id(self, user_id: str) -> UserResponse | None:
@@ -75,10 +81,8 @@ class UserService:
         Returns:
             UserResponse if found, None otherwise.
         """
-        for user in self._users.values():
-            if user.email == email:
-                return user
-        return None
+        user_id = self._email_index.get(email)
+        return self._users.get(user_id) if user_id is not None else None
 
     def delete_user(self, user_id: str) -> bool:
         """Delete a user.
@@ -89,8 +93,9 @@ class UserService:
         Returns:
             True if deleted, False if not found.
         """
-        if user_id in self._users:
-            del self._users[user_id]
+        user = self._users.pop(user_id, None)
+        if user is not None:
+            self._email_index.pop(user.email, None)
             lg.info(f"Deleted user {user_id}")
             return True
         return False
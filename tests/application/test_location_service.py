@@ -1,12 +1,9 @@
 """Tests for LocationService."""
 
-from collections.abc import Generator
 import uuid
 
 import pytest
 from sqlmodel import Session
-from sqlmodel import SQLModel
-from sqlmodel import create_engine
 
 from shelf_mind.application.errors import DuplicateSiblingNameError
 from shelf_mind.application.errors import LocationHasChildrenError
@@ -19,16 +16,6 @@ from shelf_mind.infrastructure.db.location_repo import SqlLocationRepository
 from shelf_mind.infrastructure.db.placement_repo import SqlPlacementRepository
 
 
-@pytest.fixture
-def db_session() -> Generator[Session]:
-    """Create an in-memory SQLite session."""
-    engine = create_engine("sqlite://", connect_args={"check_same_thread": False})
-    SQLModel.metadata.create_all(engine)
-    with Session(engine) as session:
-        yield session
-    SQLModel.metadata.drop_all(engine)
-
-
 @pytest.fixture
 def location_service(db_session: Session) -> LocationService:
     """Build a LocationService with an in-memory repo.
@@ -117,6 +104,19 @@ class TestLocationService:
         children = location_service.get_children(parent.id)
         assert len(children) == 2
 
+    def test_get_full_tree(self, location_service: LocationService) -> None:
+        """Should group every location under its parent in path order."""
+        home = location_service.create_location("Home")
+        kitchen = location_service.create_location("Kitchen", parent_id=home.id)
+        location_service.create_location("Bedroom", parent_id=home.id)
+        location_service.create_location("Drawer", parent_id=kitchen.id)
+        garage = location_service.create_location("Garage")
+
+        tree = location_service.get_full_tree()
+        assert [loc.id for loc in tree[None]] == [garage.id, home.id]
+        assert [loc.name for loc in tree[home.id]] == ["Bedroom", "Kitchen"]
+        assert [loc.name for loc in tree[kitchen.id]] == ["Drawer"]
+
     def test_rename_location(self, location_service: LocationService) -> None:
         """Should rename and update path."""
         loc = location_service.create_location("Kitchn")
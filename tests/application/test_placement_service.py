@@ -4,9 +4,9 @@ from collections.abc import Generator
 import uuid
 
 import pytest
+from sqlalchemy import Engine
 from sqlmodel import Session
-from sqlmodel import SQLModel
-from sqlmodel import create_engine
+from sqlmodel import delete
 
 from shelf_mind.application.errors import LocationNotFoundError
 from shelf_mind.application.errors import ThingNotFoundError
@@ -16,16 +16,7 @@ from shelf_mind.domain.entities.thing import Thing
 from shelf_mind.infrastructure.db.location_repo import SqlLocationRepository
 from shelf_mind.infrastructure.db.placement_repo import SqlPlacementRepository
 from shelf_mind.infrastructure.db.thing_repo import SqlThingRepository
-
-
-@pytest.fixture
-def db_session() -> Generator[Session]:
-    """Create an in-memory SQLite session."""
-    engine = create_engine("sqlite://", connect_args={"check_same_thread": False})
-    SQLModel.metadata.create_all(engine)
-    with Session(engine) as session:
-        yield session
-    SQLModel.metadata.drop_all(engine)
+from tests.helpers import fake_uuid
 
 
 @pytest.fixture
@@ -45,26 +36,36 @@ def placement_service(db_session: Session) -> PlacementService:
     )
 
 
-def _seed_data(session: Session) -> tuple[Thing, Location, Location]:
-    """Create test thing and locations.
+@pytest.fixture(scope="module")
+def seeded_ids(
+    db_engine: Engine,
+) -> Generator[tuple[uuid.UUID, uuid.UUID, uuid.UUID]]:
+    """Insert one thing and two locations once for the whole module.
+
+    Committed outside any test transaction, so every test sees the same
+    rows while its own changes are still rolled back. The rows are
+    deleted afterwards because the engine is shared by the whole run.
 
     Args:
-        session: Database session.
+        db_engine: Session-scoped test engine.
 
-    Returns:
-        Tuple of (thing, location1, location2).
+    Yields:
+        Tuple of (thing_id, location1_id, location2_id).
     """
     thing = Thing(name="Test Thing")
     loc1 = Location(name="Kitchen", path="/Kitchen")
     loc2 = Location(name="Bedroom", path="/Bedroom")
-    session.add(thing)
-    session.add(loc1)
-    session.add(loc2)
-    session.commit()
-    session.refresh(thing)
-    session.refresh(loc1)
-    session.refresh(loc2)
-    return thing, loc1, loc2
+    # IDs are generated client-side; read them before commit expires the
+    # instances, which would otherwise reload each one with a SELECT
+    ids = (thing.id, loc1.id, loc2.id)
+    with Session(db_engine) as session:
+        session.add_all([thing, loc1, loc2])
+        session.commit()
+    yield ids
+    with Session(db_engine) as session:
+        session.exec(delete(Thing).where(Thing.id == ids[0]))
+        session.exec(delete(Location).where(Location.id.in_(ids[1:])))
+        session.commit()
 
 
 class TestPlacementService:
@@ -73,90 +74,90 @@ class TestPlacementService:
     def test_place_thing(
         self,
         placement_service: PlacementService,
-        db_session: Session,
+        seeded_ids: tuple[uuid.UUID, uuid.UUID, uuid.UUID],
     ) -> None:
         """Should place a thing at a location."""
-        thing, loc, _ = _seed_data(db_session)
-        placement = placement_service.place_thing(thing.id, loc.id)
+        thing_id, loc_id, _ = seeded_ids
+        placement = placement_service.place_thing(thing_id, loc_id)
         assert placement.active is True
-        assert placement.thing_id == thing.id
-        assert placement.location_id == loc.id
+        assert placement.thing_id == thing_id
+        assert placement.location_id == loc_id
 
     def test_place_thing_deactivates_old(
         self,
         placement_service: PlacementService,
-        db_session: Session,
+        seeded_ids: tuple[uuid.UUID, uuid.UUID, uuid.UUID],
     ) -> None:
         """Moving should deactivate previous placement."""
-        thing, loc1, loc2 = _seed_data(db_session)
+        thing_id, loc1_id, loc2_id = seeded_ids
 
-        _p1 = placement_service.place_thing(thing.id, loc1.id)
-        p2 = placement_service.place_thing(thing.id, loc2.id)
+        _p1 = placement_service.place_thing(thing_id, loc1_id)
+        p2 = placement_service.place_thing(thing_id, loc2_id)
 
         # New placement is active
         assert p2.active is True
 
         # Old placement should be inactive
-        current = placement_service.get_current_placement(thing.id)
+        current = placement_service.get_current_placement(thing_id)
         assert current is not None
         assert current.id == p2.id
 
     def test_place_thing_not_found(
         self,
         placement_service: PlacementService,
-        db_session: Session,
+        seeded_ids: tuple[uuid.UUID, uuid.UUID, uuid.UUID],
     ) -> None:
         """Should raise for missing thing."""
-        _, loc, _ = _seed_data(db_session)
+        _, loc_id, _ = seeded_ids
         with pytest.raises(ThingNotFoundError):
-            placement_service.place_thing(uuid.uuid4(), loc.id)
+            placement_service.place_thing(fake_uuid(), loc_id)
 
     def test_place_location_not_found(
         self,
         placement_service: PlacementService,
-        db_session: Session,
+        seeded_ids: tuple[uuid.UUID, uuid.UUID, uuid.UUID],
     ) -> None:
         """Should raise for missing location."""
-        thing, _, _ = _seed_data(db_session)
+        thing_id, _, _ = seeded_ids
         with pytest.raises(LocationNotFoundError):
-            placement_service.place_thing(thing.id, uuid.uuid4())
+            placement_service.place_thing(thing_id, fake_uuid())
 
     def test_get_placement_history(
         self,
         placement_service: PlacementService,
-        db_session: Session,
+        seeded_ids: tuple[uuid.UUID, uuid.UUID, uuid.UUID],
     ) -> None:
         """Should return full placement history."""
-        thing, loc1, loc2 = _seed_data(db_session)
-        placement_service.place_thing(thing.id, loc1.id)
-        placement_service.place_thing(thing.id, loc2.id)
+        thing_id, loc1_id, loc2_id = seeded_ids
+        placement_service.place_thing(thing_id, loc1_id)
+        placement_service.place_thing(thing_id, loc2_id)
 
-        history = placement_service.get_placement_history(thing.id)
+        history = placement_service.get_placement_history(thing_id)
         assert len(history) == 2
 
     def test_get_things_at_location(
         self,
         placement_service: PlacementService,
-        db_session: Session,
+        seeded_ids: tuple[uuid.UUID, uuid.UUID, uuid.UUID],
     ) -> None:
         """Should list things at a location."""
-        thing, loc, _ = _seed_data(db_session)
-        placement_service.place_thing(thing.id, loc.id)
+        thing_id, loc_id, _ = seeded_ids
+        placement_service.place_thing(thing_id, loc_id)
 
-        placements = placement_service.get_things_at_location(loc.id)
+        placements = placement_service.get_things_at_location(loc_id)
         assert len(placements) == 1
 
     def test_remove_placement(
         self,
         placement_service: PlacementService,
-        db_session: Session,
+        seeded_ids: tuple[uuid.UUID, uuid.UUID, uuid.UUID],
     ) -> None:
         """Should deactivate current placement."""
-        thing, loc, _ = _seed_data(db_session)
-        placement_service.place_thing(thing.id, loc.id)
+        thing_id, loc_id, _ = seeded_ids
+        placement_service.place_thing(thing_id, loc_id)
 
-        count = placement_service.remove_placement(thing.id)
+        count = placement_service.remove_placement(thing_id)
         assert count == 1
 
-        current = placement_service.get_current_placement(thing.id)
+        current = placement_service.get_current_placement(thing_id)
         assert current is None
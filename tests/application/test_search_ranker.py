@@ -1,11 +1,10 @@
 """Tests for SearchRanker."""
 
-import uuid
-
 import pytest
 
 from shelf_mind.application.services.search_ranker import SearchRanker
 from shelf_mind.domain.schemas.search_schemas import SearchResult
+from tests.helpers import fake_uuid
 
 
 def _make_result(
@@ -26,7 +25,7 @@ def _make_result(
         A SearchResult instance.
     """
     return SearchResult(
-        thing_id=uuid.uuid4(),
+        thing_id=fake_uuid(),
         name=name,
         score=score,
         tags=tags or [],
@@ -34,76 +33,118 @@ def _make_result(
     )
 
 
-class TestSearchRanker:
-    """Tests for the SearchRanker."""
-
-    def test_rank_preserves_order_without_bonuses(self) -> None:
-        """Without metadata or location, ranking should follow vector score."""
-        ranker = SearchRanker(alpha=1.0, beta=0.0, gamma=0.0)
-        results = [
-            _make_result("low", score=0.3),
-            _make_result("high", score=0.9),
-            _make_result("mid", score=0.6),
-        ]
-
-        ranked = ranker.rank(results)
-        assert ranked[0].name == "high"
-        assert ranked[1].name == "mid"
-        assert ranked[2].name == "low"
+@pytest.fixture(scope="module")
+def sample_results() -> dict[str, SearchResult]:
+    """Build the shared result pool once; ranking never mutates its input.
 
-    def test_rank_with_tag_overlap(self) -> None:
-        """Metadata overlap should boost matching results."""
-        ranker = SearchRanker(alpha=0.5, beta=0.5, gamma=0.0)
-        results = [
-            _make_result("no_tags", score=0.8, tags=[]),
-            _make_result("tagged", score=0.5, tags=["phone", "charger"]),
-        ]
+    Returns:
+        SearchResults keyed by name.
+    """
+    results = [
+        _make_result("low", score=0.3),
+        _make_result("high", score=0.9),
+        _make_result("mid", score=0.6),
+        _make_result("no_tags", score=0.8, tags=[]),
+        _make_result("tagged", score=0.5, tags=["phone", "charger"]),
+        _make_result("far", score=0.7, location_path="/Office"),
+        _make_result("near", score=0.65, location_path="/Home/Kitchen"),
+        _make_result("direct", score=0.0, location_path="/Home"),
+        _make_result("ancestor", score=0.0, location_path="/Home/Kitchen"),
+    ]
+    return {result.name: result for result in results}
 
-        ranked = ranker.rank(results, query_tags=["phone", "charger"])
-        # Tagged result should be boosted significantly
-        assert ranked[0].name == "tagged"
 
-    def test_rank_with_location_bonus(self) -> None:
-        """Location match should add bonus."""
-        ranker = SearchRanker(alpha=0.5, beta=0.0, gamma=0.5)
-        results = [
-            _make_result("far", score=0.7, location_path="/Office"),
-            _make_result("near", score=0.6, location_path="/Home/Kitchen"),
-        ]
+class TestSearchRanker:
+    """Tests for the SearchRanker."""
 
-        _ranked = ranker.rank(results, location_path="/Home/Kitchen")
-        # near: 0.5*0.6 + 0.5*0.1 = 0.35, far: 0.5*0.7 + 0 = 0.35 => tied
-        # Increase gap so bonus wins clearly
-        results2 = [
-            _make_result("far", score=0.7, location_path="/Office"),
-            _make_result("near", score=0.65, location_path="/Home/Kitchen"),
-        ]
-        ranked2 = ranker.rank(results2, location_path="/Home/Kitchen")
-        # near: 0.5*0.65 + 0.5*0.1 = 0.375, far: 0.5*0.7 = 0.35
-        assert ranked2[0].name == "near"
+    @pytest.mark.parametrize(
+        ("weights", "names", "query_tags", "location_path", "expected"),
+        [
+            pytest.param(
+                (1.0, 0.0, 0.0),
+                ["low", "high", "mid"],
+                None,
+                None,
+                ["high", "mid", "low"],
+                id="vector-score-order",
+            ),
+            pytest.param(
+                (0.5, 0.5, 0.0),
+                ["no_tags", "tagged"],
+                ["phone", "charger"],
+                None,
+                ["tagged", "no_tags"],
+                id="tag-overlap-boost",
+            ),
+            pytest.param(
+                # near: 0.5*0.65 + 0.5*0.1 = 0.375, far: 0.5*0.7 = 0.35
+                (0.5, 0.0, 0.5),
+                ["far", "near"],
+                None,
+                "/Home/Kitchen",
+                ["near", "far"],
+                id="location-bonus",
+            ),
+            pytest.param(
+                (0.0, 0.0, 1.0),
+                ["ancestor", "direct"],
+                None,
+                "/Home",
+                ["direct", "ancestor"],
+                id="direct-beats-ancestor",
+            ),
+        ],
+    )
+    def test_rank_order(
+        self,
+        sample_results: dict[str, SearchResult],
+        weights: tuple[float, float, float],
+        names: list[str],
+        query_tags: list[str] | None,
+        location_path: str | None,
+        expected: list[str],
+    ) -> None:
+        """Ranking should order results by the weighted combined score."""
+        alpha, beta, gamma = weights
+        ranker = SearchRanker(alpha=alpha, beta=beta, gamma=gamma)
+        ranked = ranker.rank(
+            [sample_results[name] for name in names],
+            query_tags=query_tags,
+            location_path=location_path,
+        )
+        assert [r.name for r in ranked] == expected
 
-    def test_rank_location_ancestor_bonus(self) -> None:
+    def test_rank_location_ancestor_bonus(
+        self,
+        sample_results: dict[str, SearchResult],
+    ) -> None:
         """Ancestor match should get smaller bonus than direct match."""
         ranker = SearchRanker(alpha=0.0, beta=0.0, gamma=1.0)
-        results = [
-            _make_result("direct", score=0.0, location_path="/Home"),
-            _make_result("ancestor", score=0.0, location_path="/Home/Kitchen"),
-        ]
-
-        ranked = ranker.rank(results, location_path="/Home")
+        ranked = ranker.rank(
+            [sample_results["direct"], sample_results["ancestor"]],
+            location_path="/Home",
+        )
         # Direct match (+0.1) should beat ancestor match (+0.05)
-        assert ranked[0].name == "direct"
         assert ranked[0].score == pytest.approx(0.1)
         assert ranked[1].score == pytest.approx(0.05)
 
-    def test_jaccard_similarity(self) -> None:
+    @pytest.mark.parametrize(
+        ("items_a", "items_b", "expected"),
+        [
+            pytest.param(("a", "b"), ("a", "b"), 1.0, id="same"),
+            pytest.param(("a", "b"), ("a", "c"), 1 / 3, id="partial"),
+            pytest.param((), ("a",), 0.0, id="empty"),
+        ],
+    )
+    def test_jaccard_similarity(
+        self,
+        items_a: tuple[str, ...],
+        items_b: tuple[str, ...],
+        expected: float,
+    ) -> None:
         """Jaccard similarity should compute correctly."""
-        ranker = SearchRanker()
-        assert ranker._jaccard_similarity({"a", "b"}, {"a", "b"}) == 1.0
-        assert ranker._jaccard_similarity({"a", "b"}, {"a", "c"}) == pytest.approx(
-            1 / 3,
-        )
-        assert ranker._jaccard_similarity(set(), {"a"}) == 0.0
+        similarity = SearchRanker._jaccard_similarity(set(items_a), set(items_b))
+        assert similarity == pytest.approx(expected)
 
     def test_empty_results(self) -> None:
         """Should handle empty result list."""
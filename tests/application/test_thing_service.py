@@ -0,0 +1,95 @@
+"""Tests for ThingService."""
+
+from unittest.mock import MagicMock
+
+import pytest
+from sqlmodel import Session
+
+from shelf_mind.application.errors import LocationNotFoundError
+from shelf_mind.application.services.thing_service import ThingService
+from shelf_mind.domain.entities.location import Location
+from shelf_mind.infrastructure.db.location_repo import SqlLocationRepository
+from shelf_mind.infrastructure.db.placement_repo import SqlPlacementRepository
+from shelf_mind.infrastructure.db.thing_repo import SqlThingRepository
+from shelf_mind.infrastructure.metadata.metadata_enricher import (
+    RuleBasedMetadataEnricher,
+)
+from tests.helpers import fake_uuid
+
+
+@pytest.fixture
+def vector_repo() -> MagicMock:
+    """Stand in for the Qdrant vector repository."""
+    return MagicMock()
+
+
+@pytest.fixture
+def thing_service(db_session: Session, vector_repo: MagicMock) -> ThingService:
+    """Build a ThingService with SQL repos and a stubbed vector store.
+
+    Args:
+        db_session: Test database session.
+        vector_repo: Mock vector repository.
+
+    Returns:
+        ThingService instance.
+    """
+    embedder = MagicMock()
+    embedder.embed.return_value = [0.0, 1.0]
+    return ThingService(
+        repo=SqlThingRepository(db_session),
+        vector_repo=vector_repo,
+        embedder=embedder,
+        enricher=RuleBasedMetadataEnricher(),
+        placement_repo=SqlPlacementRepository(db_session),
+        location_repo=SqlLocationRepository(db_session),
+    )
+
+
+class TestCreateAndPlace:
+    """Tests for ThingService.create_and_place."""
+
+    def test_create_and_place(
+        self,
+        db_session: Session,
+        thing_service: ThingService,
+        vector_repo: MagicMock,
+    ) -> None:
+        """Should create the thing with an active placement and index it."""
+        location = SqlLocationRepository(db_session).create(
+            Location(name="Kitchen", path="/Kitchen"),
+        )
+
+        thing = thing_service.create_and_place("Mug", location.id, "Blue mug")
+
+        placement = SqlPlacementRepository(db_session).get_active_for_thing(thing.id)
+        assert placement is not None
+        assert placement.location_id == location.id
+        vector_repo.upsert_text_vector.assert_called_once()
+        thing_id, _, payload = vector_repo.upsert_text_vector.call_args.args
+        assert thing_id == thing.id
+        assert payload["location_path"] == "/Kitchen"
+
+    def test_create_and_place_location_not_found(
+        self,
+        thing_service: ThingService,
+        vector_repo: MagicMock,
+    ) -> None:
+        """Should raise for a missing location before writing anything."""
+        with pytest.raises(LocationNotFoundError):
+            thing_service.create_and_place("Mug", fake_uuid())
+        vector_repo.upsert_text_vector.assert_not_called()
+
+    def test_create_and_place_without_location_repo(
+        self,
+        db_session: Session,
+    ) -> None:
+        """Should raise when the service has no location repository."""
+        service = ThingService(
+            repo=SqlThingRepository(db_session),
+            vector_repo=MagicMock(),
+            embedder=MagicMock(),
+            enricher=RuleBasedMetadataEnricher(),
+        )
+        with pytest.raises(RuntimeError):
+            service.create_and_place("Mug", fake_uuid())
@@ -5,12 +5,22 @@ import pytest
 from shelf_mind.config.shelf_mind_config import ShelfMindConfig
 
 
+@pytest.fixture(scope="class")
+def default_config() -> ShelfMindConfig:
+    """Build the default config once; the tests only read it.
+
+    Returns:
+        ShelfMindConfig with all defaults.
+    """
+    return ShelfMindConfig()
+
+
 class TestShelfMindConfig:
     """Tests for the domain configuration."""
 
-    def test_default_values(self) -> None:
+    def test_default_values(self, default_config: ShelfMindConfig) -> None:
         """Config should have sensible defaults."""
-        config = ShelfMindConfig()
+        config = default_config
         assert config.database_url == "sqlite:///data/shelf_mind.db"
         assert config.qdrant_url == "http://localhost:6333"
         assert config.qdrant_collection == "things"
@@ -31,8 +41,8 @@ class TestShelfMindConfig:
         assert config.rank_beta == 0.3
         assert config.rank_gamma == 0.2
 
-    def test_scoring_weights(self) -> None:
+    def test_scoring_weights(self, default_config: ShelfMindConfig) -> None:
         """Default scoring weights should sum to 1.0."""
-        config = ShelfMindConfig()
+        config = default_config
         total = config.rank_alpha + config.rank_beta + config.rank_gamma
         assert total == pytest.approx(1.0)
@@ -1,39 +1,32 @@
 """Tests for WebappParams."""
 
-from collections.abc import Generator
-import os
-
 import pytest
 
 from shelf_mind.params.env_type import EnvLocationType
 from shelf_mind.params.env_type import EnvStageType
 from shelf_mind.params.webapp import WebappParams
 
+WEBAPP_VARS = (
+    "WEBAPP_HOST",
+    "WEBAPP_PORT",
+    "PORT",
+    "WEBAPP_DEBUG",
+    "SESSION_SECRET_KEY",
+    "GOOGLE_CLIENT_ID",
+    "GOOGLE_CLIENT_SECRET",
+    "CORS_ALLOWED_ORIGINS",
+)
 
-@pytest.fixture
-def clean_env() -> Generator[None]:
-    """Remove webapp-related environment variables."""
-    webapp_vars = [
-        "WEBAPP_HOST",
-        "WEBAPP_PORT",
-        "WEBAPP_DEBUG",
-        "SESSION_SECRET_KEY",
-        "GOOGLE_CLIENT_ID",
-        "GOOGLE_CLIENT_SECRET",
-        "CORS_ALLOWED_ORIGINS",
-    ]
-    original = {k: os.environ.get(k) for k in webapp_vars}
-
-    for var in webapp_vars:
-        if var in os.environ:
-            del os.environ[var]
 
-    yield
+@pytest.fixture
+def clean_env(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Remove webapp-related environment variables for the test.
 
-    # Restore original values
-    for var, value in original.items():
-        if value is not None:
-            os.environ[var] = value
+    monkeypatch restores them, and undoes any ``setenv`` made by the test,
+    on teardown.
+    """
+    for var in WEBAPP_VARS:
+        monkeypatch.delenv(var, raising=False)
 
 
 def test_webapp_params_dev_defaults(clean_env: None) -> None:
@@ -49,13 +42,19 @@ def test_webapp_params_dev_defaults(clean_env: None) -> None:
     assert params.session_secret_key  # Should auto-generate in dev
 
 
-def test_webapp_params_from_env(clean_env: None) -> None:
+def test_webapp_params_from_env(
+    clean_env: None,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
     """Test WebappParams loads from environment variables."""
-    os.environ["WEBAPP_HOST"] = "127.0.0.1"
-    os.environ["WEBAPP_PORT"] = "9000"
-    os.environ["WEBAPP_DEBUG"] = "true"
-    os.environ["SESSION_SECRET_KEY"] = "test_secret_key"  # noqa: S105 # pragma: allowlist secret
-    os.environ["GOOGLE_CLIENT_ID"] = "test_client_id"
+    monkeypatch.setenv("WEBAPP_HOST", "127.0.0.1")
+    monkeypatch.setenv("WEBAPP_PORT", "9000")
+    monkeypatch.setenv("WEBAPP_DEBUG", "true")
+    monkeypatch.setenv(
+        "SESSION_SECRET_KEY",
+        "test_secret_key",  # pragma: allowlist secret
+    )
+    monkeypatch.setenv("GOOGLE_CLIENT_ID", "test_client_id")
 
     params = WebappParams(
         stage=EnvStageType.DEV,
@@ -69,9 +68,15 @@ def test_webapp_params_from_env(clean_env: None) -> None:
     assert params.google_client_id == "test_client_id"
 
 
-def test_webapp_params_cors_from_env(clean_env: None) -> None:
+def test_webapp_params_cors_from_env(
+    clean_env: None,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
     """Test CORS origins parsed from comma-separated string."""
-    os.environ["CORS_ALLOWED_ORIGINS"] = "http://localhost:3000,https://example.com"
+    monkeypatch.setenv(
+        "CORS_ALLOWED_ORIGINS",
+        "http://localhost:3000,https://example.com",
+    )
 
     params = WebappParams(
         stage=EnvStageType.DEV,
@@ -91,10 +96,16 @@ def test_webapp_params_prod_requires_secrets(clean_env: None) -> None:
         )
 
 
-def test_webapp_params_prod_with_secrets(clean_env: None) -> None:
+def test_webapp_params_prod_with_secrets(
+    clean_env: None,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
     """Test WebappParams works in prod with required secrets."""
-    os.environ["SESSION_SECRET_KEY"] = "production_secret_key"  # noqa: S105 # pragma: allowlist secret
-    os.environ["GOOGLE_CLIENT_ID"] = "production_client_id"
+    monkeypatch.setenv(
+        "SESSION_SECRET_KEY",
+        "production_secret_key",  # pragma: allowlist secret
+    )
+    monkeypatch.setenv("GOOGLE_CLIENT_ID", "production_client_id")
 
     params = WebappParams(
         stage=EnvStageType.PROD,
@@ -105,10 +116,13 @@ def test_webapp_params_prod_with_secrets(clean_env: None) -> None:
     assert params.session_https_only is True  # Forced in prod
 
 
-def test_webapp_params_to_config(clean_env: None) -> None:
+def test_webapp_params_to_config(
+    clean_env: None,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
     """Test WebappParams.to_config() creates valid WebappConfig."""
-    os.environ["SESSION_SECRET_KEY"] = "test_secret"  # noqa: S105 # pragma: allowlist secret
-    os.environ["GOOGLE_CLIENT_ID"] = "test_client"
+    monkeypatch.setenv("SESSION_SECRET_KEY", "test_secret")  # pragma: allowlist secret
+    monkeypatch.setenv("GOOGLE_CLIENT_ID", "test_client")
 
     params = WebappParams(
         stage=EnvStageType.DEV,
@@ -123,12 +137,15 @@ def test_webapp_params_to_config(clean_env: None) -> None:
     assert config.google_oauth.client_id == params.google_client_id
 
 
-def test_webapp_params_render_port_override(clean_env: None) -> None:
+def test_webapp_params_render_port_override(
+    clean_env: None,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
     """Test Render PORT environment variable overrides WEBAPP_PORT."""
-    os.environ["WEBAPP_PORT"] = "8000"
-    os.environ["PORT"] = "10000"  # Render sets this
-    os.environ["SESSION_SECRET_KEY"] = "test_secret"  # noqa: S105 # pragma: allowlist secret
-    os.environ["GOOGLE_CLIENT_ID"] = "test_client"
+    monkeypatch.setenv("WEBAPP_PORT", "8000")
+    monkeypatch.setenv("PORT", "10000")  # Render sets this
+    monkeypatch.setenv("SESSION_SECRET_KEY", "test_secret")  # pragma: allowlist secret
+    monkeypatch.setenv("GOOGLE_CLIENT_ID", "test_client")
 
     params = WebappParams(
         stage=EnvStageType.PROD,
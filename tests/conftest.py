@@ -0,0 +1,70 @@
+"""Shared test fixtures."""
+
+from collections.abc import Generator
+import sqlite3
+
+import pytest
+from sqlalchemy import Connection
+from sqlalchemy import Engine
+from sqlalchemy import event
+from sqlalchemy.pool import StaticPool
+from sqlmodel import Session
+from sqlmodel import SQLModel
+from sqlmodel import create_engine
+
+
+@pytest.fixture(scope="session")
+def db_engine() -> Generator[Engine]:
+    """Create one in-memory SQLite engine with the schema for the session.
+
+    pysqlite's own transaction handling is disabled so SQLAlchemy controls
+    BEGIN/SAVEPOINT, which the per-test rollback in ``db_session`` needs.
+
+    Yields:
+        Engine bound to a single shared in-memory database.
+    """
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+
+    @event.listens_for(engine, "connect")
+    def _disable_pysqlite_transactions(
+        dbapi_conn: sqlite3.Connection,
+        _record: object,
+    ) -> None:
+        dbapi_conn.isolation_level = None
+
+    @event.listens_for(engine, "begin")
+    def _emit_begin(conn: Connection) -> None:
+        conn.exec_driver_sql("BEGIN")
+
+    SQLModel.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def db_session(db_engine: Engine) -> Generator[Session]:
+    """Create a session whose changes are rolled back after each test.
+
+    Repository commits become savepoint releases inside an outer
+    transaction, so no test sees another's rows. Like the request sessions
+    in ``get_domain_session``, instances are not expired on commit, so reading
+    client-generated IDs afterwards needs no reload.
+
+    Yields:
+        SQLModel Session backed by in-memory SQLite.
+    """
+    connection = db_engine.connect()
+    transaction = connection.begin()
+    session = Session(
+        bind=connection,
+        join_transaction_mode="create_savepoint",
+        expire_on_commit=False,
+    )
+    yield session
+    session.close()
+    transaction.rollback()
+    connection.close()
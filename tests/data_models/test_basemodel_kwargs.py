@@ -11,6 +11,13 @@ class ModelForTest(BaseModelKwargs):
     kwargs: dict | None = None
 
 
+class ModelForTestBadKwargs(BaseModelKwargs):
+    """Test model whose kwargs field is not a dict."""
+
+    a: int
+    kwargs: int  # type: ignore[assignment]
+
+
 def test_to_kw_basic() -> None:
     """Test basic to_kw functionality."""
     model = ModelForTest(a=1, b="test")
@@ -43,11 +50,5 @@ def test_to_kw_kwargs_not_dict() -> None:
 
     This should not happen with type hint but good for robustness.
     """
-
-    # Override type hint for testing
-    class ModelForTestBadKwargs(BaseModelKwargs):
-        a: int
-        kwargs: int  # type: ignore[assignment]
-
     model = ModelForTestBadKwargs(a=1, kwargs=5)
     assert model.to_kw() == {"a": 1, "kwargs": 5}
@@ -0,0 +1,18 @@
+"""Helpers shared by test modules."""
+
+import itertools
+import uuid
+
+_uuid_counter = itertools.count(1)
+
+
+def fake_uuid() -> uuid.UUID:
+    """Return a process-unique UUID without reading the system RNG.
+
+    Entity IDs are random version-4 UUIDs, so a counter-based one is never
+    stored and also serves as a missing ID.
+
+    Returns:
+        A counter-based UUID.
+    """
+    return uuid.UUID(int=next(_uuid_counter))
@@ -1,13 +1,29 @@
 """Tests for SqlLocationRepository."""
 
-import uuid
-
+import pytest
+from sqlalchemy import event
 from sqlmodel import Session
 
 from shelf_mind.domain.entities.location import Location
 from shelf_mind.domain.entities.placement import Placement
 from shelf_mind.domain.entities.thing import Thing
 from shelf_mind.infrastructure.db.location_repo import SqlLocationRepository
+from tests.helpers import fake_uuid
+
+
+def _add_locations(session: Session, *paths: str) -> None:
+    """Insert fixture locations without parent links in one flush.
+
+    Each location is named after the last segment of its path.
+
+    Args:
+        session: Database session.
+        *paths: Materialized paths of the locations to insert.
+    """
+    session.add_all(
+        [Location(name=path.rsplit("/", 1)[-1], path=path) for path in paths],
+    )
+    session.commit()
 
 
 class TestSqlLocationRepository:
@@ -26,20 +42,22 @@ class TestSqlLocationRepository:
         assert fetched is not None
         assert fetched.name == "Kitchen"
 
-    def test_get_by_path(self, db_session: Session) -> None:
-        """Should retrieve by materialized path."""
+    @pytest.mark.parametrize(
+        ("lookup", "expected"),
+        [("/Kitchen", "Kitchen"), ("/nonexistent", None)],
+    )
+    def test_get_by_path(
+        self,
+        db_session: Session,
+        lookup: str,
+        expected: str | None,
+    ) -> None:
+        """Should retrieve by materialized path, or return None when missing."""
         repo = SqlLocationRepository(db_session)
-        loc = Location(name="Kitchen", path="/Kitchen")
-        repo.create(loc)
-
-        fetched = repo.get_by_path("/Kitchen")
-        assert fetched is not None
-        assert fetched.name == "Kitchen"
+        repo.create(Location(name="Kitchen", path="/Kitchen"))
 
-    def test_get_by_path_not_found(self, db_session: Session) -> None:
-        """Should return None for missing path."""
-        repo = SqlLocationRepository(db_session)
-        assert repo.get_by_path("/nonexistent") is None
+        fetched = repo.get_by_path(lookup)
+        assert (fetched.name if fetched else None) == expected
 
     def test_get_children(self, db_session: Session) -> None:
         """Should list direct children."""
@@ -60,8 +78,7 @@ class TestSqlLocationRepository:
     def test_get_children_root_level(self, db_session: Session) -> None:
         """Should list root-level locations."""
         repo = SqlLocationRepository(db_session)
-        repo.create(Location(name="Home", path="/Home"))
-        repo.create(Location(name="Office", path="/Office"))
+        _add_locations(db_session, "/Home", "/Office")
 
         roots = repo.get_children(None)
         assert len(roots) == 2
@@ -69,10 +86,13 @@ class TestSqlLocationRepository:
     def test_get_descendants(self, db_session: Session) -> None:
         """Should list all descendants by path prefix."""
         repo = SqlLocationRepository(db_session)
-        repo.create(Location(name="Home", path="/Home"))
-        repo.create(Location(name="Kitchen", path="/Home/Kitchen"))
-        repo.create(Location(name="Drawer", path="/Home/Kitchen/Drawer"))
-        repo.create(Location(name="Office", path="/Office"))
+        _add_locations(
+            db_session,
+            "/Home",
+            "/Home/Kitchen",
+            "/Home/Kitchen/Drawer",
+            "/Office",
+        )
 
         descendants = repo.get_descendants("/Home")
         assert len(descendants) == 3
@@ -82,11 +102,50 @@ class TestSqlLocationRepository:
         assert "/Home/Kitchen/Drawer" in paths
         assert "/Office" not in paths
 
+    def test_get_descendants_matches_prefix_literally(
+        self,
+        db_session: Session,
+    ) -> None:
+        """Should not treat LIKE wildcards in the prefix as patterns."""
+        repo = SqlLocationRepository(db_session)
+        _add_locations(db_session, "/Home", "/Ho_e", "/Ho_e/Shelf")
+
+        paths = {d.path for d in repo.get_descendants("/Ho_e")}
+        assert paths == {"/Ho_e", "/Ho_e/Shelf"}
+
+    def test_get_descendants_searches_path_index(self, db_session: Session) -> None:
+        """Should look up descendants with an index range, not a table scan."""
+        repo = SqlLocationRepository(db_session)
+        connection = db_session.connection()
+        executed: list[tuple[str, object]] = []
+
+        def _capture(
+            _conn: object,
+            _cursor: object,
+            statement: str,
+            parameters: object,
+            _context: object,
+            _executemany: object,
+        ) -> None:
+            executed.append((statement, parameters))
+
+        event.listen(connection, "before_cursor_execute", _capture)
+        repo.get_descendants("/Home")
+        event.remove(connection, "before_cursor_execute", _capture)
+
+        statement, parameters = executed[-1]
+        plan = connection.exec_driver_sql(
+            f"EXPLAIN QUERY PLAN {statement}",
+            parameters,  # type: ignore[arg-type]
+        ).all()
+        details = " ".join(row[-1] for row in plan)
+        assert "SEARCH" in details
+        assert "ix_location_path" in details
+
     def test_list_all(self, db_session: Session) -> None:
         """Should list all locations ordered by path."""
         repo = SqlLocationRepository(db_session)
-        repo.create(Location(name="Zebra", path="/Zebra"))
-        repo.create(Location(name="Alpha", path="/Alpha"))
+        _add_locations(db_session, "/Zebra", "/Alpha")
 
         all_locs = repo.list_all()
         assert len(all_locs) == 2
@@ -105,8 +164,7 @@ class TestSqlLocationRepository:
     def test_update_paths(self, db_session: Session) -> None:
         """Should bulk-update paths."""
         repo = SqlLocationRepository(db_session)
-        repo.create(Location(name="Kitchen", path="/Kitchen"))
-        repo.create(Location(name="Drawer", path="/Kitchen/Drawer"))
+        _add_locations(db_session, "/Kitchen", "/Kitchen/Drawer")
 
         count = repo.update_paths("/Kitchen", "/Home/Kitchen")
         assert count == 2
@@ -128,7 +186,7 @@ class TestSqlLocationRepository:
     def test_delete_not_found(self, db_session: Session) -> None:
         """Should return False for missing location."""
         repo = SqlLocationRepository(db_session)
-        assert repo.delete(uuid.uuid4()) is False
+        assert repo.delete(fake_uuid()) is False
 
     def test_has_children(self, db_session: Session) -> None:
         """Should detect if location has children."""
@@ -151,12 +209,11 @@ class TestSqlLocationRepository:
 
         assert repo.has_placements(loc.id) is False
 
+        # Thing IDs are client-generated and the unit of work orders the
+        # INSERTs by foreign key, so both rows go in with one commit
         thing = Thing(name="Spoon")
-        db_session.add(thing)
-        db_session.commit()
-
         placement = Placement(thing_id=thing.id, location_id=loc.id, active=True)
-        db_session.add(placement)
+        db_session.add_all([thing, placement])
         db_session.commit()
 
         assert repo.has_placements(loc.id) is True
@@ -1,13 +1,12 @@
 """Tests for SqlPlacementRepository."""
 
-import uuid
-
 from sqlmodel import Session
 
 from shelf_mind.domain.entities.location import Location
 from shelf_mind.domain.entities.placement import Placement
 from shelf_mind.domain.entities.thing import Thing
 from shelf_mind.infrastructure.db.placement_repo import SqlPlacementRepository
+from tests.helpers import fake_uuid
 
 
 def _make_thing_and_location(session: Session) -> tuple[Thing, Location]:
@@ -20,12 +19,11 @@ def _make_thing_and_location(session: Session) -> tuple[Thing, Location]:
         Tuple of (Thing, Location).
     """
     thing = Thing(name="Test Thing")
-    session.add(thing)
     loc = Location(name="Test Loc", path="/Test")
-    session.add(loc)
-    session.commit()
-    session.refresh(thing)
-    session.refresh(loc)
+    # IDs are generated client-side, so a flush is enough: nothing is expired
+    # and no reload SELECTs are needed
+    session.add_all([thing, loc])
+    session.flush()
     return thing, loc
 
 
@@ -49,7 +47,7 @@ class TestSqlPlacementRepository:
     def test_no_active_placement(self, db_session: Session) -> None:
         """Should return None when no active placement exists."""
         repo = SqlPlacementRepository(db_session)
-        assert repo.get_active_for_thing(uuid.uuid4()) is None
+        assert repo.get_active_for_thing(fake_uuid()) is None
 
     def test_deactivate_for_thing(self, db_session: Session) -> None:
         """Should deactivate all placements for a thing."""
@@ -104,4 +102,4 @@ class TestSqlPlacementRepository:
     def test_delete_not_found(self, db_session: Session) -> None:
         """Should return False for missing placement."""
         repo = SqlPlacementRepository(db_session)
-        assert repo.delete(uuid.uuid4()) is False
+        assert repo.delete(fake_uuid()) is False
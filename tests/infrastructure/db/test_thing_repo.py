@@ -1,11 +1,24 @@
 """Tests for SqlThingRepository."""
 
-import uuid
-
+import pytest
 from sqlmodel import Session
 
+from shelf_mind.domain.entities.location import Location
 from shelf_mind.domain.entities.thing import Thing
+from shelf_mind.infrastructure.db.placement_repo import SqlPlacementRepository
 from shelf_mind.infrastructure.db.thing_repo import SqlThingRepository
+from tests.helpers import fake_uuid
+
+
+def _add_things(session: Session, *names: str) -> None:
+    """Insert fixture things in one flush, bypassing the repository.
+
+    Args:
+        session: Database session.
+        *names: Names of the things to insert.
+    """
+    session.add_all([Thing(name=name) for name in names])
+    session.commit()
 
 
 class TestSqlThingRepository:
@@ -24,25 +37,40 @@ class TestSqlThingRepository:
         assert fetched is not None
         assert fetched.description == "USB-C charger"
 
-    def test_get_by_name(self, db_session: Session) -> None:
-        """Should find thing by exact name."""
+    def test_create_placed(self, db_session: Session) -> None:
+        """Should create a thing together with its active placement."""
+        loc = Location(name="Kitchen", path="/Kitchen")
+        db_session.add(loc)
+        db_session.commit()
+
+        repo = SqlThingRepository(db_session)
+        created = repo.create_placed(Thing(name="Whisk"), loc.id)
+
+        placement = SqlPlacementRepository(db_session).get_active_for_thing(created.id)
+        assert placement is not None
+        assert placement.location_id == loc.id
+
+    @pytest.mark.parametrize(
+        ("lookup", "expected"),
+        [("Laptop", "Laptop"), ("Nonexistent", None)],
+    )
+    def test_get_by_name(
+        self,
+        db_session: Session,
+        lookup: str,
+        expected: str | None,
+    ) -> None:
+        """Should find a thing by exact name, or return None when missing."""
         repo = SqlThingRepository(db_session)
         repo.create(Thing(name="Laptop"))
 
-        fetched = repo.get_by_name("Laptop")
-        assert fetched is not None
-        assert fetched.name == "Laptop"
-
-    def test_get_by_name_not_found(self, db_session: Session) -> None:
-        """Should return None for missing name."""
-        repo = SqlThingRepository(db_session)
-        assert repo.get_by_name("Nonexistent") is None
+        fetched = repo.get_by_name(lookup)
+        assert (fetched.name if fetched else None) == expected
 
     def test_list_all_paginated(self, db_session: Session) -> None:
         """Should paginate results."""
         repo = SqlThingRepository(db_session)
-        for i in range(5):
-            repo.create(Thing(name=f"Item {i:02d}"))
+        _add_things(db_session, *(f"Item {i:02d}" for i in range(5)))
 
         page1 = repo.list_all(offset=0, limit=2)
         assert len(page1) == 2
@@ -84,18 +112,24 @@ class TestSqlThingRepository:
     def test_delete_not_found(self, db_session: Session) -> None:
         """Should return False for missing thing."""
         repo = SqlThingRepository(db_session)
-        assert repo.delete(uuid.uuid4()) is False
+        assert repo.delete(fake_uuid()) is False
 
     def test_search_by_name(self, db_session: Session) -> None:
         """Should search by name substring."""
         repo = SqlThingRepository(db_session)
-        repo.create(Thing(name="Phone Charger"))
-        repo.create(Thing(name="Phone Case"))
-        repo.create(Thing(name="Laptop"))
+        _add_things(db_session, "Phone Charger", "Phone Case", "Laptop")
 
         results = repo.search_by_name("Phone")
         assert len(results) == 2
 
+    def test_search_by_name_limit(self, db_session: Session) -> None:
+        """Should apply the limit after ordering by name."""
+        repo = SqlThingRepository(db_session)
+        _add_things(db_session, "Phone Case", "Phone Charger", "Phone Stand")
+
+        results = repo.search_by_name("Phone", limit=2)
+        assert [t.name for t in results] == ["Phone Case", "Phone Charger"]
+
     def test_search_by_name_no_match(self, db_session: Session) -> None:
         """Should return empty for no matches."""
         repo = SqlThingRepository(db_session)
@@ -11,8 +11,14 @@ class TestNoOpVisionStrategy:
         strategy = NoOpVisionStrategy(vector_dim=512)
         result = strategy.embed(b"image_data")
         assert len(result) == 1
-        assert len(result[0]) == 512
-        assert all(v == 0.0 for v in result[0])
+        assert result[0] == [0.0] * 512
+
+    def test_embed_returns_independent_vectors(self) -> None:
+        """Mutating one result should not affect later calls."""
+        strategy = NoOpVisionStrategy(vector_dim=8)
+        first = strategy.embed(None)[0]
+        first[0] = 1.0
+        assert strategy.embed(None)[0] == [0.0] * 8
 
     def test_preprocess_passthrough(self) -> None:
         """Should return input unchanged."""
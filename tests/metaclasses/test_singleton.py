@@ -1,5 +1,8 @@
 """Test the Singleton metaclass."""
 
+from concurrent.futures import ThreadPoolExecutor
+import time
+
 from shelf_mind.metaclasses.singleton import Singleton
 
 
@@ -27,3 +30,19 @@ def test_singleton_state() -> None:
 
     instance2 = SingletonClass()
     assert instance2.value == 42
+
+
+def test_singleton_concurrent_first_call() -> None:
+    """Test that concurrent first calls build a single instance."""
+    created: list[object] = []
+
+    class SlowSingleton(metaclass=Singleton):
+        def __init__(self) -> None:
+            created.append(self)
+            time.sleep(0.01)
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        instances = list(pool.map(lambda _: SlowSingleton(), range(8)))
+
+    assert len(created) == 1
+    assert all(instance is created[0] for instance in instances)
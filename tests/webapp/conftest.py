@@ -9,6 +9,7 @@ from unittest.mock import patch
 
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
+import httpx
 import pytest
 
 from shelf_mind.config.webapp import CORSConfig
@@ -16,14 +17,49 @@ from shelf_mind.config.webapp import GoogleOAuthConfig
 from shelf_mind.config.webapp import RateLimitConfig
 from shelf_mind.config.webapp import SessionConfig
 from shelf_mind.config.webapp import WebappConfig
+from shelf_mind.webapp.core.templating import templates
 from shelf_mind.webapp.main import create_app
 from shelf_mind.webapp.schemas.auth_schemas import GoogleUserInfo
 from shelf_mind.webapp.schemas.auth_schemas import SessionData
 
+_TOKEN_JSON = {
+    "access_token": "mock_access_token",
+    "token_type": "Bearer",
+    "expires_in": 3600,
+}
+_USERINFO_JSON = {
+    "sub": "google_user_123",
+    "email": "test@example.com",
+    "email_verified": True,
+    "name": "Test User",
+    "picture": "https://example.com/photo.jpg",
+}
+
+
+def _json_response(payload: dict[str, object]) -> MagicMock:
+    """Build a mock httpx response returning ``payload`` from ``json()``.
+
+    Args:
+        payload: Decoded JSON body.
+
+    Returns:
+        Response mock whose ``raise_for_status`` succeeds.
+    """
+    response = MagicMock()
+    response.configure_mock(
+        **{"json.return_value": payload, "raise_for_status.return_value": None},
+    )
+    return response
 
-@pytest.fixture
-def test_config() -> WebappConfig:
-    """Create test webapp configuration."""
+
+@pytest.fixture(scope="session")
+def test_config(tmp_path_factory: pytest.TempPathFactory) -> WebappConfig:
+    """Create test webapp configuration with a throwaway session database.
+
+    The rate limit is raised well above any single test's traffic because
+    the session-scoped app keeps its limiter state across tests.
+    """
+    session_db = tmp_path_factory.mktemp("webapp") / "sessions.db"
     return WebappConfig(
         host="127.0.0.1",
         port=8000,
@@ -36,9 +72,10 @@ def test_config() -> WebappConfig:
         session=SessionConfig(
             secret_key="test_secret_key_for_testing_only_do_not_use_in_prod",  # noqa: S106 # pragma: allowlist secret
             max_age=3600,
+            db_path=str(session_db),
         ),
         rate_limit=RateLimitConfig(
-            requests_per_minute=100,
+            requests_per_minute=10_000,
         ),
         google_oauth=GoogleOAuthConfig(
             client_id="test_client_id",
@@ -48,19 +85,57 @@ def test_config() -> WebappConfig:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def app(test_config: WebappConfig) -> FastAPI:
-    """Create test FastAPI application."""
-    return create_app(config=test_config)
+    """Create the test FastAPI application once for the whole run.
 
+    Every template is compiled up front so no test pays the first-render
+    parse; Jinja's default cache (400 entries) already holds them all.
+    """
+    test_app = create_app(config=test_config)
+    for name in templates.env.list_templates():
+        templates.get_template(name)
+    return test_app
 
-@pytest.fixture
-def client(app: FastAPI) -> Generator[TestClient]:
-    """Create test client."""
+
+def _refuse_google_request(request: httpx.Request) -> httpx.Response:
+    """Answer any outbound Google call with a 503 instead of touching the network.
+
+    Args:
+        request: Outgoing request from the auth service.
+
+    Returns:
+        Service-unavailable response, which ``raise_for_status`` turns into
+        an ``httpx.HTTPStatusError``.
+    """
+    return httpx.Response(503, request=request)
+
+
+@pytest.fixture(scope="session")
+def live_client(app: FastAPI) -> Generator[TestClient]:
+    """Run the app lifespan once and keep one client open for the run.
+
+    The auth service's pooled HTTP client is swapped for an offline one, so
+    a callback that gets past state validation fails fast instead of
+    reaching Google.
+    """
     with TestClient(app) as test_client:
+        auth_service = app.state.auth_service
+        test_client.portal.call(auth_service.aclose)
+        auth_service._http = httpx.AsyncClient(
+            transport=httpx.MockTransport(_refuse_google_request),
+        )
         yield test_client
 
 
+@pytest.fixture
+def client(live_client: TestClient) -> Generator[TestClient]:
+    """Hand out the shared test client with an empty cookie jar."""
+    live_client.cookies.clear()
+    yield live_client
+    live_client.cookies.clear()
+
+
 @pytest.fixture
 def mock_google_user_info() -> GoogleUserInfo:
     """Create mock Google user info."""
@@ -75,9 +150,9 @@ def mock_google_user_info() -> GoogleUserInfo:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_session_data() -> SessionData:
-    """Create mock session data."""
+    """Create mock session data once; SessionData is a frozen dataclass."""
     now = datetime.now(UTC)
     return SessionData(
         session_id="test_session_id_123",
@@ -93,50 +168,36 @@ def mock_session_data() -> SessionData:
 @pytest.fixture
 def authenticated_client(
     app: FastAPI,
+    client: TestClient,
     mock_session_data: SessionData,
 ) -> Generator[TestClient]:
     """Create test client with authenticated session."""
-    with TestClient(app) as test_client:
-        # Access session store from app state and add the mock session
-        session_store = app.state.session_store
-        session_store.create_session(mock_session_data)
-
-        # Set session cookie
-        test_client.cookies.set(
-            "session",
-            mock_session_data.session_id,
-        )
+    # Access session store from app state and add the mock session
+    session_store = app.state.session_store
+    session_store.create_session(mock_session_data)
+
+    # Set session cookie
+    client.cookies.set(
+        "session",
+        mock_session_data.session_id,
+    )
 
-        yield test_client
+    yield client
+
+    # The session database outlives this test along with the shared app
+    session_store.delete_session(mock_session_data.session_id)
 
 
 @pytest.fixture
 def mock_google_oauth() -> Generator[MagicMock]:
-    """Mock Google OAuth HTTP calls."""
+    """Mock Google OAuth HTTP calls.
+
+    Fresh response mocks are built per test because tests override their
+    payloads (e.g. to add an ``id_token``).
+    """
     with patch("shelf_mind.webapp.services.auth_service.httpx.AsyncClient") as mock:
         mock_client = AsyncMock()
-        mock.return_value.__aenter__.return_value = mock_client
-
-        # Mock token exchange response
-        mock_token_response = MagicMock()
-        mock_token_response.json.return_value = {
-            "access_token": "mock_access_token",
-            "token_type": "Bearer",
-            "expires_in": 3600,
-        }
-        mock_token_response.raise_for_status = MagicMock()
-        mock_client.post.return_value = mock_token_response
-
-        # Mock user info response
-        mock_userinfo_response = MagicMock()
-        mock_userinfo_response.json.return_value = {
-            "sub": "google_user_123",
-            "email": "test@example.com",
-            "email_verified": True,
-            "name": "Test User",
-            "picture": "https://example.com/photo.jpg",
-        }
-        mock_userinfo_response.raise_for_status = MagicMock()
-        mock_client.get.return_value = mock_userinfo_response
-
+        mock.return_value = mock_client
+        mock_client.post.return_value = _json_response(_TOKEN_JSON)
+        mock_client.get.return_value = _json_response(_USERINFO_JSON)
         yield mock
@@ -1,15 +1,67 @@
 """Tests for authentication endpoints."""
 
+import asyncio
+import base64
+import json
+from unittest.mock import MagicMock
+from urllib.parse import parse_qs
+from urllib.parse import urlsplit
+
+from fastapi import FastAPI
 from fastapi.testclient import TestClient
+import pytest
 
+from shelf_mind.config.webapp import WebappConfig
 from shelf_mind.webapp.schemas.auth_schemas import SessionData
-
-
-def test_google_login_redirect(client: TestClient) -> None:
-    """Test Google login redirects to Google OAuth."""
-    response = client.get("/auth/google/login", follow_redirects=False)
-    assert response.status_code == 302
-    assert "accounts.google.com" in response.headers["location"]
+from shelf_mind.webapp.services.auth_service import GoogleAuthService
+from shelf_mind.webapp.services.auth_service import SessionStore
+
+
+@pytest.mark.parametrize(
+    ("method", "url", "status_code", "location_part"),
+    [
+        pytest.param(
+            "GET",
+            "/auth/google/login",
+            302,
+            "accounts.google.com",
+            id="login-redirects-to-google",
+        ),
+        pytest.param("GET", "/auth/me", 401, None, id="me-requires-session"),
+        pytest.param("POST", "/auth/logout", 401, None, id="logout-requires-session"),
+        pytest.param(
+            "GET",
+            "/auth/google/callback?code=test_code&state=invalid_state",
+            302,
+            "error=invalid_state",
+            id="callback-invalid-state",
+        ),
+        # code and state are required even when error is present
+        pytest.param(
+            "GET",
+            "/auth/google/callback?code=test&state=test&error=access_denied",
+            302,
+            "error=access_denied",
+            id="callback-google-error",
+        ),
+    ],
+)
+def test_unauthenticated_auth_requests(
+    client: TestClient,
+    method: str,
+    url: str,
+    status_code: int,
+    location_part: str | None,
+) -> None:
+    """Test auth endpoints answer anonymous requests with a status or redirect."""
+    response = client.request(method, url, follow_redirects=False)
+    assert response.status_code == status_code
+    location = response.headers.get("location")
+    if location_part is None:
+        assert location is None
+    else:
+        assert location is not None
+        assert location_part in location
 
 
 def test_google_login_no_redirect(client: TestClient) -> None:
@@ -23,6 +75,17 @@ def test_google_login_no_redirect(client: TestClient) -> None:
     assert "accounts.google.com" in data["auth_url"]
 
 
+def test_google_callback_token_exchange_failure(client: TestClient) -> None:
+    """Test a valid callback whose token exchange fails redirects with an error."""
+    state = client.get("/auth/google/login?redirect=false").json()["state"]
+    response = client.get(
+        f"/auth/google/callback?code=test_code&state={state}",
+        follow_redirects=False,
+    )
+    assert response.status_code == 302
+    assert response.headers["location"] == "/?error=auth_failed"
+
+
 def test_auth_status_unauthenticated(client: TestClient) -> None:
     """Test auth status when not authenticated."""
     response = client.get("/auth/status")
@@ -46,12 +109,6 @@ def test_auth_status_authenticated(
     assert data["user"]["email"] == mock_session_data.email
 
 
-def test_get_current_user_unauthenticated(client: TestClient) -> None:
-    """Test /auth/me returns 401 when not authenticated."""
-    response = client.get("/auth/me")
-    assert response.status_code == 401
-
-
 def test_get_current_user_authenticated(
     authenticated_client: TestClient,
     mock_session_data: SessionData,
@@ -65,13 +122,8 @@ def test_get_current_user_authenticated(
     assert data["name"] == mock_session_data.name
 
 
-def test_logout_unauthenticated(client: TestClient) -> None:
-    """Test logout returns 401 when not authenticated."""
-    response = client.post("/auth/logout")
-    assert response.status_code == 401
-
-
 def test_logout_authenticated(
+    app: FastAPI,
     authenticated_client: TestClient,
     mock_session_data: SessionData,
 ) -> None:
@@ -83,30 +135,11 @@ def test_logout_authenticated(
     )
     assert response.status_code == 200
 
-    # Verify session is cleared
-    status_response = authenticated_client.get("/auth/status")
-    assert status_response.json()["authenticated"] is False
-
-
-def test_google_callback_invalid_state(client: TestClient) -> None:
-    """Test callback with invalid state parameter."""
-    response = client.get(
-        "/auth/google/callback?code=test_code&state=invalid_state",
-        follow_redirects=False,
-    )
-    assert response.status_code == 302
-    assert "error=invalid_state" in response.headers["location"]
-
-
-def test_google_callback_with_error(client: TestClient) -> None:
-    """Test callback when Google returns an error."""
-    # code and state are required even when error is present
-    response = client.get(
-        "/auth/google/callback?code=test&state=test&error=access_denied",
-        follow_redirects=False,
-    )
-    assert response.status_code == 302
-    assert "error=access_denied" in response.headers["location"]
+    # Verify the session is gone server-side and the cookie is expired
+    session_store = app.state.session_store
+    assert session_store.get_session(mock_session_data.session_id) is None
+    assert "session=" in response.headers["set-cookie"]
+    assert "Max-Age=0" in response.headers["set-cookie"]
 
 
 def test_logout_browser_redirects(
@@ -132,3 +165,91 @@ def test_logout_htmx_returns_hx_redirect(
     )
     assert response.status_code == 200
     assert response.headers.get("HX-Redirect") == "/"
+
+
+def test_session_data_json_round_trip(mock_session_data: SessionData) -> None:
+    """Test SessionData survives the JSON form used by the SQLite store."""
+    restored = SessionData.from_json(mock_session_data.to_json())
+    assert restored == mock_session_data
+
+
+def test_authenticate_reuses_shared_client(
+    test_config: WebappConfig,
+    mock_google_oauth: MagicMock,
+) -> None:
+    """Test the OAuth flow runs on one shared HTTP client."""
+    service = GoogleAuthService(
+        oauth_config=test_config.google_oauth,
+        session_config=test_config.session,
+        session_store=SessionStore(),
+    )
+    _, state = service.get_authorization_url()
+    session = asyncio.run(service.authenticate("code", state))
+
+    assert session.email == "test@example.com"
+    mock_google_oauth.assert_called_once()
+    asyncio.run(service.aclose())
+
+
+def test_authorization_url_params(test_config: WebappConfig) -> None:
+    """Test the authorization URL carries config params and a fresh state."""
+    service = GoogleAuthService(
+        oauth_config=test_config.google_oauth,
+        session_config=test_config.session,
+        session_store=SessionStore(),
+    )
+    url, state = service.get_authorization_url()
+    params = parse_qs(urlsplit(url).query)
+
+    assert params["client_id"] == [test_config.google_oauth.client_id]
+    assert params["scope"] == [" ".join(test_config.google_oauth.scopes)]
+    assert params["state"] == [state]
+    assert service.get_authorization_url()[1] != state
+    asyncio.run(service.aclose())
+
+
+def test_session_data_reads_isoformat_json(mock_session_data: SessionData) -> None:
+    """Test SessionData parses JSON written with ``datetime.isoformat``."""
+    raw = json.dumps(
+        {
+            "session_id": mock_session_data.session_id,
+            "user_id": mock_session_data.user_id,
+            "email": mock_session_data.email,
+            "name": mock_session_data.name,
+            "created_at": mock_session_data.created_at.isoformat(),
+            "expires_at": mock_session_data.expires_at.isoformat(),
+            "picture": mock_session_data.picture,
+        },
+    )
+    assert SessionData.from_json(raw) == mock_session_data
+
+
+def test_authenticate_uses_id_token_claims(
+    test_config: WebappConfig,
+    mock_google_oauth: MagicMock,
+) -> None:
+    """Test the userinfo call is skipped when the ID token has the claims."""
+    claims = {
+        "aud": test_config.google_oauth.client_id,
+        "sub": "google_user_456",
+        "email": "idtoken@example.com",
+        "name": "Token User",
+    }
+    payload = base64.urlsafe_b64encode(json.dumps(claims).encode()).rstrip(b"=")
+    mock_client = mock_google_oauth.return_value
+    mock_client.post.return_value.json.return_value = {
+        "access_token": "mock_access_token",
+        "id_token": f"header.{payload.decode()}.signature",
+    }
+    service = GoogleAuthService(
+        oauth_config=test_config.google_oauth,
+        session_config=test_config.session,
+        session_store=SessionStore(),
+    )
+    _, state = service.get_authorization_url()
+    session = asyncio.run(service.authenticate("code", state))
+
+    assert session.user_id == "google_user_456"
+    assert session.email == "idtoken@example.com"
+    mock_client.get.assert_not_called()
+    asyncio.run(service.aclose())
@@ -1,34 +1,39 @@
 """Tests for health check endpoints."""
 
 from fastapi.testclient import TestClient
-
-
-def test_health_check(client: TestClient) -> None:
-    """Test basic health check endpoint."""
-    response = client.get("/health")
-    assert response.status_code == 200
-
-    data = response.json()
-    assert data["status"] == "healthy"
-    assert "version" in data
-    assert "timestamp" in data
-
-
-def test_readiness_check(client: TestClient) -> None:
-    """Test readiness probe endpoint."""
-    response = client.get("/health/ready")
-    assert response.status_code == 200
-
-    data = response.json()
-    assert "status" in data
-    assert "checks" in data
-    assert isinstance(data["checks"], dict)
-
-
-def test_liveness_check(client: TestClient) -> None:
-    """Test liveness probe endpoint."""
-    response = client.get("/health/live")
+import pytest
+
+
+@pytest.mark.parametrize(
+    ("path", "status", "fields"),
+    [
+        pytest.param(
+            "/health",
+            "healthy",
+            {"version": str, "timestamp": str},
+            id="health",
+        ),
+        pytest.param(
+            "/health/ready",
+            None,
+            {"status": str, "checks": dict},
+            id="ready",
+        ),
+        pytest.param("/health/live", "alive", {}, id="live"),
+    ],
+)
+def test_health_endpoints(
+    client: TestClient,
+    path: str,
+    status: str | None,
+    fields: dict[str, type],
+) -> None:
+    """Test the health, readiness and liveness probes."""
+    response = client.get(path)
     assert response.status_code == 200
 
     data = response.json()
-    assert data["status"] == "alive"
+    if status is not None:
+        assert data["status"] == status
+    for key, kind in fields.items():
+        assert isinstance(data[key], kind)
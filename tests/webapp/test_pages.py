@@ -1,29 +1,74 @@
 """Tests for HTML page routes (landing, dashboard, error, partials)."""
 
-from fastapi.testclient import TestClient
+from collections.abc import Generator
+from unittest.mock import MagicMock
 
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+import httpx
+import pytest
+from sqlmodel import Session
+
+from shelf_mind.application.services.thing_service import ThingService
+from shelf_mind.domain.entities.location import Location
+from shelf_mind.infrastructure.db.location_repo import SqlLocationRepository
+from shelf_mind.infrastructure.db.placement_repo import SqlPlacementRepository
+from shelf_mind.infrastructure.db.thing_repo import SqlThingRepository
+from shelf_mind.infrastructure.metadata.metadata_enricher import (
+    RuleBasedMetadataEnricher,
+)
+from shelf_mind.webapp.core.dependencies import get_domain_container
+from shelf_mind.webapp.core.dependencies import get_domain_session
+from shelf_mind.webapp.core.templating import render_cache
 from shelf_mind.webapp.schemas.auth_schemas import SessionData
 
 
+@pytest.fixture(scope="class")
+def landing_response(live_client: TestClient) -> httpx.Response:
+    """Render the anonymous landing page once; the tests only read it."""
+    live_client.cookies.clear()
+    return live_client.get("/", follow_redirects=False)
+
+
+@pytest.fixture(scope="class")
+def dashboard_response(
+    app: FastAPI,
+    live_client: TestClient,
+    mock_session_data: SessionData,
+) -> httpx.Response:
+    """Render the dashboard once for a signed-in user; the tests only read it."""
+    session_store = app.state.session_store
+    session_store.create_session(mock_session_data)
+    live_client.cookies.clear()
+    live_client.cookies.set("session", mock_session_data.session_id)
+    try:
+        return live_client.get("/dashboard")
+    finally:
+        live_client.cookies.clear()
+        session_store.delete_session(mock_session_data.session_id)
+
+
 class TestLandingPage:
     """Tests for GET / (landing page)."""
 
-    def test_landing_returns_html(self, client: TestClient) -> None:
+    def test_landing_returns_html(self, landing_response: httpx.Response) -> None:
         """Landing page returns 200 with HTML content type."""
-        response = client.get("/", follow_redirects=False)
-        assert response.status_code == 200
-        assert "text/html" in response.headers["content-type"]
+        assert landing_response.status_code == 200
+        assert "text/html" in landing_response.headers["content-type"]
 
-    def test_landing_contains_login_link(self, client: TestClient) -> None:
+    def test_landing_contains_login_link(
+        self,
+        landing_response: httpx.Response,
+    ) -> None:
         """Landing page contains a Google login link."""
-        response = client.get("/")
-        assert response.status_code == 200
-        assert "/auth/google/login" in response.text
+        assert "/auth/google/login" in landing_response.text
 
-    def test_landing_contains_app_name(self, client: TestClient) -> None:
+    def test_landing_contains_app_name(
+        self,
+        landing_response: httpx.Response,
+    ) -> None:
         """Landing page renders the application name."""
-        response = client.get("/")
-        assert "Test API" in response.text
+        assert "Test API" in landing_response.text
 
     def test_landing_with_error_param(self, client: TestClient) -> None:
         """Landing page displays flash message for OAuth error."""
@@ -52,14 +97,13 @@ class TestDashboardPage:
 
     def test_dashboard_authenticated(
         self,
-        authenticated_client: TestClient,
+        dashboard_response: httpx.Response,
         mock_session_data: SessionData,
     ) -> None:
         """Authenticated users see the dashboard with their info."""
-        response = authenticated_client.get("/dashboard")
-        assert response.status_code == 200
-        assert "text/html" in response.headers["content-type"]
-        assert mock_session_data.name in response.text
+        assert dashboard_response.status_code == 200
+        assert "text/html" in dashboard_response.headers["content-type"]
+        assert mock_session_data.name in dashboard_response.text
 
     def test_dashboard_unauthenticated_redirects(
         self,
@@ -76,22 +120,18 @@ class TestDashboardPage:
 
     def test_dashboard_contains_logout(
         self,
-        authenticated_client: TestClient,
+        dashboard_response: httpx.Response,
     ) -> None:
         """Dashboard contains a logout form/button."""
-        response = authenticated_client.get("/dashboard")
-        assert response.status_code == 200
-        assert "/auth/logout" in response.text
+        assert "/auth/logout" in dashboard_response.text
 
     def test_dashboard_contains_htmx_partial(
         self,
-        authenticated_client: TestClient,
+        dashboard_response: httpx.Response,
     ) -> None:
         """Dashboard loads user card via HTMX partial."""
-        response = authenticated_client.get("/dashboard")
-        assert response.status_code == 200
-        assert "hx-get" in response.text
-        assert "/pages/partials/user-card" in response.text
+        assert "hx-get" in dashboard_response.text
+        assert "/pages/partials/user-card" in dashboard_response.text
 
 
 class TestUserCardPartial:
@@ -111,6 +151,23 @@ class TestUserCardPartial:
         # Should be a fragment, not a full page
         assert "<!DOCTYPE html>" not in response.text
 
+    def test_user_card_etag_revalidation(
+        self,
+        authenticated_client: TestClient,
+    ) -> None:
+        """Partial is revalidated with a 304 when the ETag still matches."""
+        first = authenticated_client.get("/pages/partials/user-card")
+        etag = first.headers["etag"]
+        assert "no-cache" in first.headers["cache-control"]
+        assert "Cookie" in first.headers["vary"]
+
+        second = authenticated_client.get(
+            "/pages/partials/user-card",
+            headers={"If-None-Match": etag},
+        )
+        assert second.status_code == 304
+        assert second.content == b""
+
     def test_user_card_unauthenticated(self, client: TestClient) -> None:
         """Unauthenticated request to partial returns 401 or redirect."""
         response = client.get(
@@ -124,68 +181,134 @@ class TestUserCardPartial:
 class TestErrorPage:
     """Tests for GET /error/{status_code}."""
 
-    def test_error_404(self, client: TestClient) -> None:
-        """404 error page renders correctly."""
-        response = client.get("/error/404")
-        assert response.status_code == 404
+    @pytest.mark.parametrize(
+        ("status_code", "message_part"),
+        [
+            # Jinja2 auto-escapes the apostrophe in "you're" to &#39;
+            (404, "looking for"),
+            (500, "on our end"),
+            (418, "unexpected error"),
+        ],
+    )
+    def test_error_page(
+        self,
+        client: TestClient,
+        status_code: int,
+        message_part: str,
+    ) -> None:
+        """Error page renders with the status code and its message."""
+        response = client.get(f"/error/{status_code}")
+        assert response.status_code == status_code
         assert "text/html" in response.headers["content-type"]
-        assert "404" in response.text
-        # Jinja2 auto-escapes the apostrophe to &#39;
-        assert "looking for" in response.text
+        assert str(status_code) in response.text
+        assert message_part in response.text
+
+    def test_unknown_codes_are_not_cached(self, client: TestClient) -> None:
+        """Arbitrary error codes render without taking render-cache slots."""
+        cached = len(render_cache)
+        assert client.get("/?error=not_a_known_code").status_code == 200
+        assert client.get("/error/418").status_code == 418
+        assert len(render_cache) == cached
+
+
+@pytest.fixture
+def thing_service_app(app: FastAPI, db_session: Session) -> Generator[MagicMock]:
+    """Point the page routes at the test database and a stub container.
+
+    The container builds real SQL-backed ThingServices, with the vector
+    store and embedder mocked out so no Qdrant or model is needed.
+
+    Yields:
+        Mock vector repository the services index into.
+    """
+    vector_repo = MagicMock()
+    embedder = MagicMock()
+    embedder.embed.return_value = [0.0, 1.0]
+    container = MagicMock()
+    container.thing_service.side_effect = lambda session: ThingService(
+        repo=SqlThingRepository(session),
+        vector_repo=vector_repo,
+        embedder=embedder,
+        enricher=RuleBasedMetadataEnricher(),
+        placement_repo=SqlPlacementRepository(session),
+        location_repo=SqlLocationRepository(session),
+    )
+    app.dependency_overrides[get_domain_session] = lambda: db_session
+    app.dependency_overrides[get_domain_container] = lambda: container
+    yield vector_repo
+    app.dependency_overrides.pop(get_domain_session, None)
+    app.dependency_overrides.pop(get_domain_container, None)
+
+
+class TestCreateThingPage:
+    """Tests for POST /pages/things/create."""
+
+    def test_create_thing_with_location(
+        self,
+        authenticated_client: TestClient,
+        db_session: Session,
+        thing_service_app: MagicMock,
+    ) -> None:
+        """The form creates the thing already placed at the chosen location."""
+        location = SqlLocationRepository(db_session).create(
+            Location(name="Garage", path="/Garage"),
+        )
 
-    def test_error_500(self, client: TestClient) -> None:
-        """500 error page renders correctly."""
-        response = client.get("/error/500")
-        assert response.status_code == 500
-        assert "500" in response.text
+        # Double-submit CSRF: the header must echo the cookie
+        authenticated_client.cookies.set("csrf_token", "test-csrf-token")
+        response = authenticated_client.post(
+            "/pages/things/create",
+            data={"name": "Drill", "location_id": str(location.id)},
+            headers={"X-CSRF-Token": "test-csrf-token"},
+        )
 
-    def test_error_unknown_code(self, client: TestClient) -> None:
-        """Unknown error code shows generic message."""
-        response = client.get("/error/418")
-        assert response.status_code == 418
-        assert "418" in response.text
+        assert response.status_code == 200
+        assert "Registered <strong>Drill</strong>" in response.text
+        thing = SqlThingRepository(db_session).get_by_name("Drill")
+        assert thing is not None
+        placement = SqlPlacementRepository(db_session).get_active_for_thing(thing.id)
+        assert placement is not None
+        assert placement.location_id == location.id
+        thing_service_app.upsert_text_vector.assert_called_once()
 
 
 class TestStaticAssets:
     """Tests for static file serving."""
 
-    def test_bulma_css_served(self, client: TestClient) -> None:
-        """Bulma CSS is served from /static/css/bulma.min.css."""
-        response = client.get("/static/css/bulma.min.css")
-        assert response.status_code == 200
-        assert "text/css" in response.headers["content-type"]
-
-    def test_htmx_js_served(self, client: TestClient) -> None:
-        """HTMX JS is served from /static/js/htmx.min.js."""
-        response = client.get("/static/js/htmx.min.js")
-        assert response.status_code == 200
-        assert "javascript" in response.headers["content-type"]
-
-    def test_app_css_served(self, client: TestClient) -> None:
-        """Custom app CSS is served from /static/css/app.css."""
-        response = client.get("/static/css/app.css")
-        assert response.status_code == 200
-        assert "text/css" in response.headers["content-type"]
-
-    def test_logo_served(self, client: TestClient) -> None:
-        """Logo is served from /static/img/logo.svg."""
-        response = client.get("/static/img/logo.svg")
-        assert response.status_code == 200
-
-    def test_swagger_js_served(self, client: TestClient) -> None:
-        """Swagger UI JS is served from /static/swagger/swagger-ui-bundle.js."""
-        response = client.get("/static/swagger/swagger-ui-bundle.js")
-        assert response.status_code == 200
-        assert "javascript" in response.headers["content-type"]
-
-    def test_swagger_css_served(self, client: TestClient) -> None:
-        """Swagger UI CSS is served from /static/swagger/swagger-ui.css."""
-        response = client.get("/static/swagger/swagger-ui.css")
-        assert response.status_code == 200
-        assert "text/css" in response.headers["content-type"]
+    @pytest.mark.parametrize(
+        ("url", "content_type"),
+        [
+            pytest.param("/static/css/bulma.min.css", "text/css", id="bulma-css"),
+            pytest.param("/static/js/htmx.min.js", "javascript", id="htmx-js"),
+            pytest.param("/static/css/app.css", "text/css", id="app-css"),
+            pytest.param("/static/img/logo.svg", "image/svg", id="logo"),
+            pytest.param(
+                "/static/swagger/swagger-ui-bundle.js",
+                "javascript",
+                id="swagger-js",
+            ),
+            pytest.param(
+                "/static/swagger/swagger-ui.css",
+                "text/css",
+                id="swagger-css",
+            ),
+            pytest.param(
+                "/static/swagger/redoc.standalone.js",
+                "javascript",
+                id="redoc-js",
+            ),
+        ],
+    )
+    def test_static_asset_served(
+        self,
+        client: TestClient,
+        url: str,
+        content_type: str,
+    ) -> None:
+        """Static assets are served with their content type.
 
-    def test_redoc_js_served(self, client: TestClient) -> None:
-        """ReDoc JS is served from /static/swagger/redoc.standalone.js."""
-        response = client.get("/static/swagger/redoc.standalone.js")
+        HEAD gets the same headers from StaticFiles without reading the body.
+        """
+        response = client.head(url)
         assert response.status_code == 200
-        assert "javascript" in response.headers["content-type"]
+        assert content_type in response.headers["content-type"]
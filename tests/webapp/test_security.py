@@ -1,11 +1,29 @@
 """Tests for security headers, CSP route-splitting, and CSRF protection."""
 
+from datetime import UTC
+from datetime import datetime
+from datetime import timedelta
+
+from fastapi import FastAPI
 from fastapi.testclient import TestClient
+import httpx
+import pytest
+
+from shelf_mind.webapp.core.middleware import SecurityHeadersMiddleware
+from shelf_mind.webapp.core.security import is_expired
+from shelf_mind.webapp.core.security import utc_timestamp
+
 
+@pytest.fixture(scope="module")
+def health_response(live_client: TestClient) -> httpx.Response:
+    """One anonymous ``/health`` response shared by the header-only checks."""
+    live_client.cookies.clear()
+    return live_client.get("/health")
 
-def test_security_headers_present(client: TestClient) -> None:
+
+def test_security_headers_present(health_response: httpx.Response) -> None:
     """Test that security headers are present in responses."""
-    response = client.get("/health")
+    response = health_response
 
     # Check required security headers
     assert "x-content-type-options" in response.headers
@@ -55,9 +73,9 @@ def test_cors_blocked_origin(client: TestClient) -> None:
     # Note: The actual CORS behavior depends on middleware configuration
 
 
-def test_no_hsts_in_debug_mode(client: TestClient) -> None:
+def test_no_hsts_in_debug_mode(health_response: httpx.Response) -> None:
     """Test that HSTS header is not set in debug/dev mode."""
-    response = client.get("/health")
+    response = health_response
 
     # In debug mode, HSTS should not be set
     # (our test config has debug=True)
@@ -82,10 +100,34 @@ def test_strict_csp_on_app_pages(client: TestClient) -> None:
     assert "lh3.googleusercontent.com" in csp
 
 
-def test_strict_csp_on_api_routes(client: TestClient) -> None:
+def test_htmx_fragments_keep_document_headers(client: TestClient) -> None:
+    """HTMX sub-requests get the full header set and vary on HX-Request."""
+    response = client.get("/health", headers={"HX-Request": "true"})
+
+    assert response.headers["x-content-type-options"] == "nosniff"
+    assert "content-security-policy" in response.headers
+    assert response.headers["x-frame-options"] == "DENY"
+    assert "HX-Request" in response.headers["vary"]
+
+
+def test_htmx_fragments_keep_hsts_in_production() -> None:
+    """HSTS applies to fragments too, not only to full documents."""
+    app = FastAPI()
+    app.add_middleware(SecurityHeadersMiddleware, is_production=True)
+
+    @app.get("/fragment")
+    async def fragment() -> dict[str, str]:
+        return {"ok": "yes"}
+
+    response = TestClient(app).get("/fragment", headers={"HX-Request": "true"})
+
+    assert "strict-transport-security" in response.headers
+    assert "content-security-policy" in response.headers
+
+
+def test_strict_csp_on_api_routes(health_response: httpx.Response) -> None:
     """API routes also get the strict CSP (no CDN)."""
-    response = client.get("/health")
-    csp = response.headers["content-security-policy"]
+    csp = health_response.headers["content-security-policy"]
 
     assert "cdn.jsdelivr.net" not in csp
     assert "script-src 'self' 'unsafe-inline'" not in csp
@@ -108,3 +150,12 @@ def test_relaxed_csp_on_openapi_json(client: TestClient) -> None:
     if response.status_code == 200:
         csp = response.headers["content-security-policy"]
         assert "'unsafe-inline'" in csp
+
+
+def test_expiry_checks() -> None:
+    """Test the cached clock orders past and future times correctly."""
+    now = datetime.now(UTC)
+    past, future = now - timedelta(seconds=5), now + timedelta(seconds=5)
+    assert is_expired(past)
+    assert not is_expired(future)
+    assert past.timestamp() < utc_timestamp() < future.timestamp()
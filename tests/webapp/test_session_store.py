@@ -0,0 +1,239 @@
+"""Tests for the session stores."""
+
+import asyncio
+from collections.abc import Generator
+from datetime import UTC
+from datetime import datetime
+from datetime import timedelta
+from pathlib import Path
+import sqlite3
+
+import pytest
+
+from shelf_mind.webapp.schemas.auth_schemas import SessionData
+from shelf_mind.webapp.services import auth_service
+from shelf_mind.webapp.services.auth_service import SessionStore
+from shelf_mind.webapp.services.auth_service import SqliteSessionStore
+
+
+@pytest.fixture
+def store(tmp_path: Path) -> Generator[SqliteSessionStore]:
+    """Create a store backed by a temporary database file."""
+    session_store = SqliteSessionStore(db_path=str(tmp_path / "sessions.db"))
+    yield session_store
+    session_store.close()
+
+
+def _make_session(session_id: str, expires_in: timedelta) -> SessionData:
+    """Build a session expiring ``expires_in`` from now.
+
+    Args:
+        session_id: Session identifier.
+        expires_in: Offset from now (negative for already expired).
+
+    Returns:
+        SessionData instance.
+    """
+    now = datetime.now(UTC)
+    return SessionData(
+        session_id=session_id,
+        user_id="user-1",
+        email="test@example.com",
+        name="Test User",
+        created_at=now,
+        expires_at=now + expires_in,
+    )
+
+
+def test_create_and_get_session(store: SqliteSessionStore) -> None:
+    """Test that a stored session is returned intact."""
+    session = _make_session("live", timedelta(hours=1))
+    store.create_session(session)
+    assert store.get_session("live") == session
+
+
+def test_get_missing_session(store: SqliteSessionStore) -> None:
+    """Test that unknown session ids return None."""
+    assert store.get_session("missing") is None
+
+
+def test_expired_session_is_dropped_on_read(store: SqliteSessionStore) -> None:
+    """Test that reading an expired session deletes it."""
+    store.create_session(_make_session("old", timedelta(seconds=-1)))
+    assert store.get_session("old") is None
+    assert store.cleanup_expired() == 0
+
+
+def test_delete_session(store: SqliteSessionStore) -> None:
+    """Test that deleted sessions are no longer returned."""
+    store.create_session(_make_session("gone", timedelta(hours=1)))
+    store.delete_session("gone")
+    assert store.get_session("gone") is None
+
+
+def test_cleanup_expired(store: SqliteSessionStore) -> None:
+    """Test that cleanup removes only expired sessions."""
+    store.create_session(_make_session("old", timedelta(seconds=-1)))
+    store.create_session(_make_session("live", timedelta(hours=1)))
+    assert store.cleanup_expired() == 1
+    assert store.get_session("live") is not None
+
+
+def test_sessions_persist_across_instances(tmp_path: Path) -> None:
+    """Test that sessions survive reopening the database."""
+    db_path = str(tmp_path / "sessions.db")
+    first = SqliteSessionStore(db_path=db_path)
+    first.create_session(_make_session("kept", timedelta(hours=1)))
+    first.close()
+
+    second = SqliteSessionStore(db_path=db_path)
+    assert second.get_session("kept") is not None
+    second.close()
+
+
+def test_cleanup_uses_expiry_index(store: SqliteSessionStore) -> None:
+    """Test that the expiry delete is served by the expires_at index."""
+    plan = store._conn.execute(
+        "EXPLAIN QUERY PLAN DELETE FROM sessions WHERE expires_at < ?",
+        (int(datetime.now(UTC).timestamp()),),
+    ).fetchall()
+    assert any("idx_sessions_expires_at" in row[-1] for row in plan)
+
+
+def test_legacy_text_expiry_is_migrated(tmp_path: Path) -> None:
+    """Test that ISO-8601 text expiries are converted to epoch seconds."""
+    db_path = str(tmp_path / "sessions.db")
+    session = _make_session("legacy", timedelta(hours=1))
+    conn = sqlite3.connect(db_path)
+    conn.execute(
+        "CREATE TABLE sessions (session_id TEXT PRIMARY KEY, "
+        "data TEXT NOT NULL, expires_at TEXT NOT NULL)",
+    )
+    conn.execute(
+        "INSERT INTO sessions VALUES (?, ?, ?)",
+        ("legacy", session.to_json(), session.expires_at.isoformat()),
+    )
+    conn.commit()
+    conn.close()
+
+    migrated = SqliteSessionStore(db_path=db_path)
+    assert migrated.get_session("legacy") == session
+    assert migrated.cleanup_expired() == 0
+    migrated.close()
+
+
+def test_legacy_rowid_table_is_rebuilt(tmp_path: Path) -> None:
+    """Test that a rowid sessions table is rebuilt as WITHOUT ROWID."""
+    db_path = str(tmp_path / "sessions.db")
+    session = _make_session("legacy", timedelta(hours=1))
+    conn = sqlite3.connect(db_path)
+    conn.execute(
+        "CREATE TABLE sessions (session_id TEXT PRIMARY KEY, "
+        "data TEXT NOT NULL, expires_at INTEGER NOT NULL)",
+    )
+    conn.execute(
+        "INSERT INTO sessions VALUES (?, ?, ?)",
+        ("legacy", session.to_json(), int(session.expires_at.timestamp())),
+    )
+    conn.commit()
+    conn.close()
+
+    migrated = SqliteSessionStore(db_path=db_path)
+    (sql,) = migrated._conn.execute(
+        "SELECT sql FROM sqlite_master WHERE name = 'sessions'",
+    ).fetchone()
+    assert "WITHOUT ROWID" in sql
+    assert migrated.get_session("legacy") == session
+    migrated.close()
+
+
+@pytest.mark.parametrize(("n_expired", "n_live"), [(1, 3), (3, 1)])
+def test_memory_cleanup_expired(n_expired: int, n_live: int) -> None:
+    """Test in-memory cleanup both below and above the rebuild threshold."""
+    memory_store = SessionStore()
+    for i in range(n_expired):
+        memory_store.create_session(_make_session(f"old-{i}", timedelta(seconds=-1)))
+    for i in range(n_live):
+        memory_store.create_session(_make_session(f"live-{i}", timedelta(hours=1)))
+    memory_store.store_state_token("expired-state", ttl_seconds=-1)
+    memory_store.store_state_token("live-state")
+
+    assert memory_store.cleanup_expired() == n_expired + 1
+    assert all(memory_store.get_session(f"live-{i}") for i in range(n_live))
+    assert memory_store.validate_state_token("live-state")
+
+
+def test_cleanup_deletes_in_batches(
+    store: SqliteSessionStore,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that expired sessions spanning several batches are all removed."""
+    monkeypatch.setattr(auth_service, "_CLEANUP_BATCH_SIZE", 2)
+    for i in range(5):
+        store.create_session(_make_session(f"old-{i}", timedelta(seconds=-1)))
+    store.create_session(_make_session("live", timedelta(hours=1)))
+    assert store.cleanup_expired() == 5
+    assert store.get_session("live") is not None
+
+
+def test_cleanup_loop_purges_periodically() -> None:
+    """Test that the background loop purges expired sessions."""
+    memory_store = SessionStore()
+    memory_store.create_session(_make_session("old", timedelta(seconds=-1)))
+
+    async def run_once() -> None:
+        task = asyncio.create_task(memory_store.run_cleanup_loop(0))
+        await asyncio.sleep(0.01)
+        task.cancel()
+
+    asyncio.run(run_once())
+    assert "old" not in memory_store._sessions
+
+
+def test_sqlite_async_cleanup_expired(store: SqliteSessionStore) -> None:
+    """Test that the async cleanup purges sessions and state tokens."""
+    store.create_session(_make_session("old", timedelta(seconds=-1)))
+    store.create_session(_make_session("live", timedelta(hours=1)))
+    store.store_state_token("expired-state", ttl_seconds=-1)
+
+    assert asyncio.run(store.acleanup_expired()) == 2
+    assert store.get_session("live") is not None
+
+
+def test_memory_store_evicts_oldest_when_full() -> None:
+    """Test that a full in-memory store evicts its oldest live session."""
+    memory_store = SessionStore(max_sessions=2)
+    for sid in ("first", "second", "third"):
+        memory_store.create_session(_make_session(sid, timedelta(hours=1)))
+    assert memory_store.get_session("first") is None
+    assert memory_store.get_session("third") is not None
+
+
+def test_memory_store_purges_expired_before_evicting() -> None:
+    """Test that expired sessions make room before live ones are evicted."""
+    memory_store = SessionStore(max_sessions=2)
+    memory_store.create_session(_make_session("live", timedelta(hours=1)))
+    memory_store.create_session(_make_session("old", timedelta(seconds=-1)))
+    memory_store.create_session(_make_session("new", timedelta(hours=1)))
+    assert memory_store.get_session("live") is not None
+    assert memory_store.get_session("new") is not None
+
+
+def test_state_tokens_are_bounded() -> None:
+    """Test that flooding state tokens keeps only the newest ones."""
+    memory_store = SessionStore(max_state_tokens=3)
+    for i in range(10):
+        memory_store.store_state_token(f"state-{i}")
+    assert len(memory_store._state_tokens) == 3
+    assert memory_store.validate_state_token("state-9")
+    assert not memory_store.validate_state_token("state-0")
+
+
+def test_get_session_identity(store: SqliteSessionStore) -> None:
+    """Test that the identity lookup returns user id and email only."""
+    store.create_session(_make_session("live", timedelta(hours=1)))
+    store.create_session(_make_session("old", timedelta(seconds=-1)))
+    assert store.get_session_identity("live") == ("user-1", "test@example.com")
+    assert store.get_session_identity("old") is None
+    assert store.get_session_identity("missing") is None
+    assert store.cleanup_expired() == 0
@@ -0,0 +1,48 @@
+"""Tests for the rendered-HTML cache."""
+
+import pytest
+
+from shelf_mind.webapp.core.templating import RenderCache
+
+
+def test_render_cache_hit_and_miss() -> None:
+    """Test that stored entries are returned and unknown keys miss."""
+    cache = RenderCache()
+    cache.set(("landing", ""), "<html></html>")
+    assert cache.get(("landing", "")) == "<html></html>"
+    assert cache.get(("landing", "access_denied")) is None
+
+
+def test_render_cache_evicts_least_recently_used() -> None:
+    """Test that the oldest untouched entry is evicted when full."""
+    cache = RenderCache(maxsize=2)
+    cache.set("a", "A")
+    cache.set("b", "B")
+    cache.get("a")
+    cache.set("c", "C")
+    assert len(cache) == 2
+    assert cache.get("b") is None
+    assert cache.get("a") == "A"
+    assert cache.get("c") == "C"
+
+
+def test_render_cache_expires_entries(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that entries older than the TTL are dropped."""
+    now = 1000.0
+    monkeypatch.setattr(
+        "shelf_mind.webapp.core.templating.time.monotonic",
+        lambda: now,
+    )
+    cache = RenderCache(ttl=10.0)
+    cache.set("k", "v")
+    now = 1011.0
+    assert cache.get("k") is None
+    assert len(cache) == 0
+
+
+def test_render_cache_clear() -> None:
+    """Test that clear drops every entry."""
+    cache = RenderCache()
+    cache.set("k", "v")
+    cache.clear()
+    assert cache.get("k") is None
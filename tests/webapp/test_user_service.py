@@ -0,0 +1,53 @@
+"""Tests for the in-memory user service."""
+
+from shelf_mind.webapp.schemas.auth_schemas import GoogleUserInfo
+from shelf_mind.webapp.services.user_service import UserService
+
+
+def _info(email: str, name: str = "Test User") -> GoogleUserInfo:
+    """Build Google user info for a fixed subject.
+
+    Args:
+        email: User email address.
+        name: Display name.
+
+    Returns:
+        GoogleUserInfo instance.
+    """
+    return GoogleUserInfo(sub="google_user_123", email=email, name=name)
+
+
+def test_get_user_by_email() -> None:
+    """Test that created users can be found by email."""
+    service = UserService()
+    user = service.get_or_create_user(_info("test@example.com"))
+    assert service.get_user_by_email("test@example.com") == user
+    assert service.get_user_by_email("other@example.com") is None
+
+
+def test_email_change_updates_index() -> None:
+    """Test that an updated email replaces the old index entry."""
+    service = UserService()
+    service.get_or_create_user(_info("old@example.com"))
+    service.get_or_create_user(_info("new@example.com"))
+    assert service.get_user_by_email("old@example.com") is None
+    assert service.get_user_by_email("new@example.com") is not None
+
+
+def test_delete_user_removes_email() -> None:
+    """Test that deleting a user drops its email lookup."""
+    service = UserService()
+    user = service.get_or_create_user(_info("test@example.com"))
+    assert service.delete_user(user.id)
+    assert service.get_user_by_email("test@example.com") is None
+    assert not service.delete_user(user.id)
+
+
+def test_unchanged_user_is_reused() -> None:
+    """Test that re-login with identical info returns the same model."""
+    service = UserService()
+    first = service.get_or_create_user(_info("test@example.com"))
+    assert service.get_or_create_user(_info("test@example.com")) is first
+    renamed = service.get_or_create_user(_info("test@example.com", name="New"))
+    assert renamed is not first
+    assert renamed.name == "New"